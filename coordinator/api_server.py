@@ -1,20 +1,129 @@
 from aiohttp import web
-import json
+from multidict import CIMultiDict
+import asyncio
 import logging
+import os
+import re
+import threading
+import time
+from contextlib import aclosing
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Dict, Optional
+import aiofiles
+import aiofiles.os
+import orjson
 
 
 logger = logging.getLogger(__name__)
 
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+_CORS_HEADERS = CIMultiDict({
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+})
+
+# '%(asctime)s - %(name)s - %(levelname)s - %(message)s', matched on raw bytes
+_LOG_RE = re.compile(rb'^(?P<ts>.*?) - .*? - (?P<lvl>\w+)(?: - (?P<msg>.*))?$')
+
+
+def _json_response(data, status=200):
+    """Serialize with orjson (handles datetime/numpy natively) into a JSON response"""
+    return web.Response(
+        body=orjson.dumps(data, option=_ORJSON_OPTIONS),
+        status=status,
+        content_type='application/json'
+    )
+
+
+@dataclass(slots=True)
+class _ModelStatus:
+    """Fixed /api/models entry shape; orjson serializes dataclasses natively"""
+    name: str
+    host: str
+    port: int
+    uptime: int
+    memory_mb: int
+    healthy: bool
+    success_rate: float
+    avg_response_time: float
+    success_count: int
+    failure_count: int
+    last_success: Optional[datetime]
+
+
+@dataclass(slots=True)
+class _Status:
+    """Fixed /api/status shape"""
+    is_running: bool
+    dry_run: bool
+    testnet: bool
+    current_position: bool
+    daily_stats: Dict[str, Any]
+    timestamp: str
+
+
+async def _take(agen, n):
+    """Collect up to `n` items from an async generator without closing it"""
+    items = []
+    while len(items) < n:
+        try:
+            items.append(await agen.__anext__())
+        except StopAsyncIteration:
+            break
+    return items
+
+
+async def _tail_lines(path, limit, chunk_size=65536):
+    """Return the last `limit` lines of a file as bytes, reading backwards in chunks"""
+    if limit <= 0:
+        return []
+    
+    async with aiofiles.open(path, 'rb') as f:
+        position = await f.seek(0, os.SEEK_END)
+        chunks = []
+        newlines = 0
+        
+        while position > 0 and newlines <= limit:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            await f.seek(position)
+            chunk = await f.read(read_size)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+    
+    return b''.join(reversed(chunks)).splitlines()[-limit:]
+
 
 class DashboardAPIServer:
-    def __init__(self, coordinator, port=5500, host='0.0.0.0'):
+    # Trades fetched per cross-thread hop when serving from start_in_thread()
+    _TRADES_CHUNK_SIZE = 64
+    
+    def __init__(self, coordinator, port=5500, host='0.0.0.0', cache_ttl=0.5):
         self.coordinator = coordinator
         self.port = port
         self.host = host
+        self.cache_ttl = cache_ttl
         self.app = web.Application()
         self.runner = None
         
+        # Set by start_in_thread(): the server's own loop/thread, and the coordinator
+        # loop that owns the database connection
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._owner_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # (key, static fields) per enabled endpoint, built lazily on first /api/models call
+        self._model_templates = None
+        # ((path, limit, mtime_ns, size), serialized body) of the last /api/logs response
+        self._logs_cache = None
+        # route -> (serialized body, monotonic expiry) for frequently polled endpoints
+        self._cache = {}
+        # (epoch second, ISO string) shared by status responses within the same second
+        self._ts_cache = (0, '')
+        
         self._setup_routes()
     
     def _setup_routes(self):
@@ -26,144 +135,237 @@ class DashboardAPIServer:
         
         self.app.router.add_options('/api/{path:.*}', self.handle_options)
         
-        self.app.middlewares.append(self.cors_middleware)
+        self.app.middlewares.append(self.error_middleware)
+        self.app.on_response_prepare.append(self._add_cors_headers)
     
     @web.middleware
-    async def cors_middleware(self, request, handler):
-        if request.method == 'OPTIONS':
-            response = web.Response()
-        else:
-            try:
-                response = await handler(request)
-            except Exception as e:
-                logger.error(f"Handler error: {e}")
-                response = web.json_response({'error': str(e)}, status=500)
-        
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
-        
-        return response
+    async def error_middleware(self, request, handler):
+        try:
+            return await handler(request)
+        except web.HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Handler error: {e}")
+            return _json_response({'error': str(e)}, status=500)
+    
+    @staticmethod
+    async def _add_cors_headers(request, response):
+        # Runs for every response, including streamed ones and HTTP errors
+        response.headers.update(_CORS_HEADERS)
     
     async def handle_options(self, request):
         return web.Response()
     
+    def _build_model_templates(self):
+        # Same endpoints the ensemble queries, so the dashboard can't disagree with it
+        return [
+            (f"{endpoint['host']}:{endpoint['port']}", endpoint['name'], endpoint['host'], endpoint['port'])
+            for endpoint in self.coordinator.ensemble.active_endpoints
+        ]
+    
+    def invalidate_cache(self):
+        """
+        Drop cached /api/status and /api/models bodies; call on coordinator state
+        changes. Safe to call from the coordinator's loop while serving from a thread.
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._cache.clear)
+        else:
+            self._cache.clear()
+    
+    def _cached_response(self, route):
+        entry = self._cache.get(route)
+        if entry is not None and time.monotonic() < entry[1]:
+            return web.Response(body=entry[0], content_type='application/json')
+        return None
+    
+    def _store_response(self, route, data):
+        body = orjson.dumps(data, option=_ORJSON_OPTIONS)
+        self._cache[route] = (body, time.monotonic() + self.cache_ttl)
+        return web.Response(body=body, content_type='application/json')
+    
     async def get_models(self, request):
         try:
+            cached = self._cached_response('models')
+            if cached is not None:
+                return cached
+            
+            if self._model_templates is None:
+                self._model_templates = self._build_model_templates()
+            
+            ensemble = self.coordinator.ensemble
+            success_counts = ensemble.success_counts
+            failure_counts = ensemble.failure_counts
+            avg_response_times = ensemble.avg_response_times
+            last_success = ensemble.last_success
             models_data = []
             
-            for endpoint in self.coordinator.ensemble.model_endpoints:
-                if not endpoint.get('enabled', True):
-                    continue
-                
-                key = f"{endpoint['host']}:{endpoint['port']}"
-                perf = self.coordinator.ensemble.model_performance.get(key, {})
-                
-                success_count = perf.get('success_count', 0)
-                failure_count = perf.get('failure_count', 0)
+            for key, name, host, port in self._model_templates:
+                success_count = success_counts.get(key, 0)
+                failure_count = failure_counts.get(key, 0)
                 total_requests = success_count + failure_count
-                success_rate = success_count / total_requests if total_requests > 0 else 0
                 
-                model_data = {
-                    'name': endpoint['name'],
-                    'host': endpoint['host'],
-                    'port': endpoint['port'],
-                    'healthy': success_count > 0 or failure_count == 0,
-                    'uptime': 0,
-                    'memory_mb': 0,
-                    'success_rate': success_rate,
-                    'avg_response_time': perf.get('avg_response_time', 0),
-                    'success_count': success_count,
-                    'failure_count': failure_count,
-                    'last_success': perf.get('last_success').isoformat() if perf.get('last_success') else None
-                }
-                
-                models_data.append(model_data)
+                models_data.append(_ModelStatus(
+                    name=name,
+                    host=host,
+                    port=port,
+                    uptime=0,
+                    memory_mb=0,
+                    healthy=total_requests == 0 or success_count > 0,
+                    success_rate=success_count / (total_requests or 1),
+                    avg_response_time=avg_response_times.get(key, 0),
+                    success_count=success_count,
+                    failure_count=failure_count,
+                    last_success=last_success.get(key)
+                ))
             
-            return web.json_response(models_data)
+            return self._store_response('models', models_data)
         
         except Exception as e:
             logger.error(f"Error getting models data: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return _json_response({'error': str(e)}, status=500)
+    
+    async def _on_owner_loop(self, coro):
+        """Await a coroutine on the loop that owns the coordinator's resources"""
+        if self._owner_loop is None or self._owner_loop is asyncio.get_running_loop():
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._owner_loop))
+    
+    async def _recent_trades(self, limit):
+        trades = self.coordinator.data_logger.stream_recent_trades(limit)
+        if self._owner_loop is None:
+            async with aclosing(trades):
+                async for trade in trades:
+                    yield trade
+            return
+        
+        # The cursor belongs to the owner loop; pull rows across in chunks rather than
+        # one hop per row, and close it there too
+        try:
+            while True:
+                chunk = await self._on_owner_loop(_take(trades, self._TRADES_CHUNK_SIZE))
+                for trade in chunk:
+                    yield trade
+                if len(chunk) < self._TRADES_CHUNK_SIZE:
+                    return
+        finally:
+            await self._on_owner_loop(trades.aclose())
     
     async def get_trades(self, request):
         try:
             limit = int(request.query.get('limit', 50))
+        except ValueError as e:
+            return _json_response({'error': str(e)}, status=500)
+        
+        async with aclosing(self._recent_trades(limit)) as trades:
+            # Pull the first row before sending headers, so a failing query still
+            # gets an error status
+            try:
+                trade = await trades.__anext__()
+            except StopAsyncIteration:
+                return _json_response([])
+            except Exception as e:
+                logger.error(f"Error getting trades: {e}")
+                return _json_response({'error': str(e)}, status=500)
             
-            trades = await self.coordinator.data_logger.get_recent_trades(limit=limit)
+            # Stream a JSON array item by item so large limits don't build the full list in memory
+            response = web.StreamResponse(headers={'Content-Type': 'application/json'})
+            await response.prepare(request)
             
-            return web.json_response(trades)
+            try:
+                await response.write(b'[' + orjson.dumps(trade, option=_ORJSON_OPTIONS))
+                async for trade in trades:
+                    await response.write(b',' + orjson.dumps(trade, option=_ORJSON_OPTIONS))
+            except Exception as e:
+                # The 200 status is already sent; drop the connection rather than close
+                # the array, so the client sees a failed transfer, not a short list
+                logger.error(f"Error streaming trades: {e}")
+                if request.transport is not None:
+                    request.transport.close()
+                return response
         
-        except Exception as e:
-            logger.error(f"Error getting trades: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+        await response.write(b']')
+        await response.write_eof()
+        return response
     
     async def get_performance(self, request):
         try:
-            stats = await self.coordinator.data_logger.get_performance_stats()
+            stats = await self._on_owner_loop(self.coordinator.data_logger.get_performance_stats())
             
-            return web.json_response(stats)
+            return _json_response(stats)
         
         except Exception as e:
             logger.error(f"Error getting performance: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return _json_response({'error': str(e)}, status=500)
     
     async def get_logs(self, request):
         try:
             limit = int(request.query.get('limit', 100))
             
-            import os
-            logs = []
-            
             log_file = self.coordinator.config.get('logging', {}).get('file', './logs/coordinator.log')
             
-            if os.path.exists(log_file):
-                with open(log_file, 'r') as f:
-                    lines = f.readlines()
-                    
-                    for line in lines[-limit:]:
-                        parts = line.strip().split(' - ')
-                        if len(parts) >= 3:
-                            timestamp = parts[0]
-                            level = parts[2] if len(parts) > 2 else 'INFO'
-                            message = ' - '.join(parts[3:]) if len(parts) > 3 else line.strip()
-                            
-                            logs.append({
-                                'timestamp': timestamp,
-                                'level': level,
-                                'message': message
-                            })
+            try:
+                stat = await aiofiles.os.stat(log_file)
+            except FileNotFoundError:
+                return _json_response([])
+            
+            # Serve the previous body if the file is unchanged since the last request
+            cache_key = (log_file, limit, stat.st_mtime_ns, stat.st_size)
+            if self._logs_cache is not None and self._logs_cache[0] == cache_key:
+                return web.Response(body=self._logs_cache[1], content_type='application/json')
+            
+            logs = []
+            for raw_line in await _tail_lines(log_file, limit):
+                line = raw_line.strip()
+                m = _LOG_RE.match(line)
+                if m is None:
+                    continue
+                
+                message = m['msg'] if m['msg'] is not None else line
+                logs.append({
+                    'timestamp': m['ts'].decode('utf-8', errors='replace'),
+                    'level': m['lvl'].decode('utf-8', errors='replace'),
+                    'message': message.decode('utf-8', errors='replace')
+                })
+            
+            body = orjson.dumps(logs, option=_ORJSON_OPTIONS)
+            self._logs_cache = (cache_key, body)
             
-            return web.json_response(logs)
+            return web.Response(body=body, content_type='application/json')
         
         except Exception as e:
             logger.error(f"Error getting logs: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return _json_response({'error': str(e)}, status=500)
+    
+    def _utc_timestamp(self):
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, datetime.utcfromtimestamp(now).isoformat())
+        return self._ts_cache[1]
     
     async def get_status(self, request):
         try:
-            # Convert daily_stats datetime to ISO format
-            daily_stats = self.coordinator.daily_stats.copy()
-            if 'start_time' in daily_stats and isinstance(daily_stats['start_time'], datetime):
-                daily_stats['start_time'] = daily_stats['start_time'].isoformat()
+            cached = self._cached_response('status')
+            if cached is not None:
+                return cached
             
-            status = {
-                'is_running': self.coordinator.is_running,
-                'dry_run': self.coordinator.config.get('dry_run', True),
-                'testnet': self.coordinator.config.get('testnet', True),
-                'current_position': self.coordinator.current_position is not None,
-                'daily_stats': daily_stats,
-                'timestamp': datetime.utcnow().isoformat()
-            }
+            status = _Status(
+                is_running=self.coordinator.is_running,
+                dry_run=self.coordinator.config.get('dry_run', True),
+                testnet=self.coordinator.config.get('testnet', True),
+                current_position=self.coordinator.current_position is not None,
+                daily_stats=self.coordinator.daily_stats,
+                timestamp=self._utc_timestamp()
+            )
             
-            return web.json_response(status)
+            return self._store_response('status', status)
         
         except Exception as e:
             logger.error(f"Error getting status: {e}")
-            return web.json_response({'error': str(e)}, status=500)
+            return _json_response({'error': str(e)}, status=500)
     
     async def start(self):
-        self.runner = web.AppRunner(self.app)
+        self.runner = web.AppRunner(self.app, access_log=None)
         await self.runner.setup()
         
         site = web.TCPSite(self.runner, self.host, self.port)
@@ -175,3 +377,33 @@ class DashboardAPIServer:
         if self.runner:
             await self.runner.cleanup()
             logger.info("Dashboard API server stopped")
+    
+    async def start_in_thread(self):
+        """
+        Serve from a dedicated event loop on a daemon thread, so dashboard
+        traffic never adds latency to the caller's (trading) loop
+        """
+        self._owner_loop = asyncio.get_running_loop()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='dashboard-api', daemon=True)
+        self._thread.start()
+        
+        try:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self.start(), self._loop))
+        except BaseException:
+            # e.g. port already in use: don't leave the runner, thread and loop behind
+            await self.stop_thread()
+            raise
+    
+    async def stop_thread(self):
+        """Stop a server started with start_in_thread() and join its thread"""
+        if self._thread is None:
+            return
+        
+        try:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self.stop(), self._loop))
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+            self._loop.close()
+            self._loop = self._thread = self._owner_loop = None
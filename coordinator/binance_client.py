@@ -4,7 +4,7 @@ Python 3.10.12 compatible
 Production-grade Binance Futures API client with:
 - Order state machine with SQLite persistence
 - Rate limiting with token bucket algorithm
-- Exponential backoff with tenacity
+- Exponential backoff for transient errors
 - Testnet and production endpoint support
 - Margin mode configuration (CROSSED/ISOLATED)
 """
@@ -12,20 +12,17 @@ Production-grade Binance Futures API client with:
 import os
 import logging
 import time
-import hmac
 import hashlib
 import aiosqlite
+from urllib.parse import urlencode, quote
 from typing import Dict, Optional, List, Tuple
 from enum import Enum
 from dataclasses import dataclass
 import asyncio
 import aiohttp
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
-)
+import orjson
+from yarl import URL
+from decimal import Decimal
 
 
 class OrderStatus(Enum):
@@ -52,7 +49,13 @@ class OrderType(Enum):
     TAKE_PROFIT_MARKET = "TAKE_PROFIT_MARKET"
 
 
-@dataclass
+# Name -> member maps for parsing API responses and DB rows without Enum.__getitem__
+_SIDE = OrderSide.__members__
+_TYPE = OrderType.__members__
+_STATUS = OrderStatus.__members__
+
+
+@dataclass(slots=True)
 class OrderState:
     """Order state for persistence"""
     order_id: int
@@ -70,29 +73,29 @@ class OrderState:
 
 
 class RateLimiter:
-    """Token bucket rate limiter"""
+    """
+    Token bucket rate limiter, kept as a theoretical arrival time (GCRA)
+    
+    No lock: acquire() reserves its slot before its only await, and the
+    event loop runs that read-modify-write without interleaving.
+    """
     
     def __init__(self, rate_per_minute: int, burst: int = None):
         self.rate = rate_per_minute / 60.0
         self.burst = burst or rate_per_minute
-        self.tokens = self.burst
-        self.last_update = time.time()
-        self.lock = asyncio.Lock()
+        self._interval = 1.0 / self.rate
+        self._tolerance = (self.burst - 1) * self._interval
+        self._next_available = 0.0
     
     async def acquire(self):
         """Acquire a token, waiting if necessary"""
-        async with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
-            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
-            self.last_update = now
-            
-            if self.tokens < 1:
-                wait_time = (1 - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
+        now = asyncio.get_running_loop().time()
+        next_available = max(self._next_available, now)
+        self._next_available = next_available + self._interval
+        
+        delay = next_available - self._tolerance - now
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 
 class BinanceClient:
@@ -108,6 +111,22 @@ class BinanceClient:
     - Order monitoring and status tracking
     """
     
+    _INSERT_ORDER_SQL = '''
+        INSERT OR REPLACE INTO orders
+        (order_id, symbol, side, type, quantity, price, status, 
+         filled_qty, avg_price, timestamp, stop_loss_order_id, take_profit_order_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    # Explicit column order matches the OrderState positional unpacking below;
+    # a constant statement text also hits sqlite3's per-connection statement cache
+    _SELECT_ORDER_SQL = '''
+        SELECT order_id, symbol, side, type, quantity, price, status,
+               filled_qty, avg_price, timestamp, stop_loss_order_id, take_profit_order_id
+        FROM orders WHERE order_id = ?
+    '''
+    _WRITE_BATCH_SIZE = 64
+    _MAX_ATTEMPTS = 3
+    
     def __init__(self, config: Dict):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -132,6 +151,7 @@ class BinanceClient:
         else:
             self.api_key = os.getenv('BINANCE_API_KEY')
             self.api_secret = os.getenv('BINANCE_API_SECRET')
+        self._hmac_inner, self._hmac_outer = self._hmac_pads((self.api_secret or '').encode('utf-8'))
         
         if not self.dry_run:
             if not self.api_key or not self.api_secret:
@@ -155,67 +175,115 @@ class BinanceClient:
         # State
         self.session: Optional[aiohttp.ClientSession] = None
         self.symbol_info: Optional[Dict] = None
+        self.symbols_by_name: Dict[str, Dict] = {}
+        # (expires_at monotonic, balance); dropped whenever an order goes out
+        self._balance_cache: Optional[Tuple[float, Dict]] = None
+        self.balance_cache_ttl = binance_config.get('balance_cache_ttl', 30.0)
+        # LOT_SIZE / PRICE_FILTER steps, resolved once from symbol_info
+        self._step_size: Optional[float] = None
+        self._qty_precision = 3
+        self._tick_size: Optional[float] = None
+        self._price_precision = 2
         self.order_db_path = './data/orders.db'
+        self.db: Optional[aiosqlite.Connection] = None
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
         
         self.logger.info(f"BinanceClient initialized: testnet={self.testnet}, "
                         f"dry_run={self.dry_run}, symbol={self.symbol}")
     
     async def initialize(self):
         """Initialize client, fetch symbol info, setup leverage and margin"""
+        # Initialize order database (dry run orders are persisted too)
+        await self._init_order_db()
+        
         if self.dry_run:
             self.logger.info("Binance client in DRY RUN mode")
             return
         
-        # Create aiohttp session
-        self.session = aiohttp.ClientSession(headers={
-            'X-MBX-APIKEY': self.api_key
-        })
-        
-        # Initialize order database
-        await self._init_order_db()
+        # Create the one aiohttp session; pooled keep-alive connections skip
+        # a TCP+TLS handshake on every signed call
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'X-MBX-APIKEY': self.api_key},
+                timeout=aiohttp.ClientTimeout(total=10, connect=3)
+            )
         
         # Fetch symbol info
         await self._fetch_symbol_info()
         
-        # Set leverage and margin mode
-        await self._set_leverage(self.symbol, self.leverage)
-        await self._set_margin_mode(self.symbol, self.margin_mode)
-        
-        # Test connection
-        await self._ping()
+        # Set leverage and margin mode and test connection; independent calls, so
+        # overlap their round trips. The setters log their own failures, a failed
+        # ping still propagates.
+        await asyncio.gather(
+            self._set_leverage(self.symbol, self.leverage),
+            self._set_margin_mode(self.symbol, self.margin_mode),
+            self._ping()
+        )
         
         self.logger.info(f"Connected to Binance {'TESTNET' if self.testnet else 'PRODUCTION'}")
     
+    @staticmethod
+    def _hmac_pads(key: bytes) -> Tuple:
+        """Pre-hash the HMAC-SHA256 inner/outer key pads (RFC 2104) once"""
+        if len(key) > 64:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(64, b'\0')
+        return (
+            hashlib.sha256(bytes(b ^ 0x36 for b in key)),
+            hashlib.sha256(bytes(b ^ 0x5c for b in key))
+        )
+    
+    def _sign(self, query_string: str) -> str:
+        """HMAC-SHA256 hex signature, resuming from the pre-hashed pads"""
+        inner = self._hmac_inner.copy()
+        inner.update(query_string.encode('utf-8'))
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+    
     async def _init_order_db(self):
-        """Initialize SQLite database for order state persistence"""
+        """Open the long-lived SQLite connection for order state persistence"""
         os.makedirs(os.path.dirname(self.order_db_path), exist_ok=True)
         
-        async with aiosqlite.connect(self.order_db_path) as db:
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS orders (
-                    order_id INTEGER PRIMARY KEY,
-                    symbol TEXT NOT NULL,
-                    side TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    quantity REAL NOT NULL,
-                    price REAL,
-                    status TEXT NOT NULL,
-                    filled_qty REAL DEFAULT 0,
-                    avg_price REAL DEFAULT 0,
-                    timestamp REAL NOT NULL,
-                    stop_loss_order_id INTEGER,
-                    take_profit_order_id INTEGER
-                )
-            ''')
-            await db.execute('CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)')
-            await db.execute('CREATE INDEX IF NOT EXISTS idx_orders_timestamp ON orders(timestamp)')
-            await db.commit()
+        self.db = await aiosqlite.connect(self.order_db_path)
+        # WAL + NORMAL sync: no rollback-journal fsync per order event
+        await self.db.executescript(
+            'PRAGMA journal_mode=WAL;'
+            'PRAGMA synchronous=NORMAL;'
+            'PRAGMA busy_timeout=5000;'
+            'PRAGMA temp_store=MEMORY;'
+        )
+        await self.db.execute('''
+            CREATE TABLE IF NOT EXISTS orders (
+                order_id INTEGER PRIMARY KEY,
+                symbol TEXT NOT NULL,
+                side TEXT NOT NULL,
+                type TEXT NOT NULL,
+                quantity REAL NOT NULL,
+                price REAL,
+                status TEXT NOT NULL,
+                filled_qty REAL DEFAULT 0,
+                avg_price REAL DEFAULT 0,
+                timestamp REAL NOT NULL,
+                stop_loss_order_id INTEGER,
+                take_profit_order_id INTEGER
+            )
+        ''')
+        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)')
+        await self.db.execute('CREATE INDEX IF NOT EXISTS idx_orders_timestamp ON orders(timestamp)')
+        await self.db.commit()
+        
+        self._writer_task = asyncio.create_task(self._writer_loop())
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError))
-    )
     async def _request(
         self,
         method: str,
@@ -224,34 +292,40 @@ class BinanceClient:
         **kwargs
     ) -> Dict:
         """Make HTTP request with rate limiting and retries"""
-        await self.rate_limiter.acquire()
-        
         url = f"{self.base_url}{endpoint}"
         
-        if signed:
-            # Add timestamp and signature
-            timestamp = int(time.time() * 1000)
-            params = kwargs.get('params', {})
-            params['timestamp'] = timestamp
-            
-            query_string = '&'.join([f"{k}={v}" for k, v in sorted(params.items())])
-            signature = hmac.new(
-                self.api_secret.encode('utf-8'),
-                query_string.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
+        for attempt in range(self._MAX_ATTEMPTS):
+            await self.rate_limiter.acquire()
             
-            params['signature'] = signature
-            kwargs['params'] = params
-        
-        async with self.session.request(method, url, **kwargs) as response:
-            data = await response.json()
-            
-            if response.status != 200:
-                self.logger.error(f"API error {response.status}: {data}")
-                raise Exception(f"Binance API error: {data.get('msg', 'Unknown error')}")
-            
-            return data
+            request_url = url
+            request_kwargs = kwargs
+            if signed:
+                # Add timestamp and signature; re-signed from the caller's params on each attempt
+                params = {**kwargs.get('params', {}), 'timestamp': time.time_ns() // 1_000_000}
+                
+                query_string = urlencode(sorted(params.items()), quote_via=quote)
+                signature = self._sign(query_string)
+                
+                # The signed string is already encoded: send it as the URL tail verbatim
+                # instead of handing params back to aiohttp to encode again
+                request_url = URL(f"{url}?{query_string}&signature={signature}", encoded=True)
+                request_kwargs = {k: v for k, v in kwargs.items() if k != 'params'}
+            
+            try:
+                async with self.session.request(method, request_url, **request_kwargs) as response:
+                    data = await response.json(loads=orjson.loads)
+                    
+                    if response.status != 200:
+                        self.logger.error(f"API error {response.status}: {data}")
+                        raise Exception(f"Binance API error: {data.get('msg', 'Unknown error')}")
+                    
+                    return data
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # Transient transport errors only; exponential backoff 2s, 4s, ... capped at 30s
+                if attempt == self._MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(min(30, 2 * 2 ** attempt))
     
     async def _ping(self):
         """Test API connectivity"""
@@ -262,14 +336,18 @@ class BinanceClient:
         """Fetch and cache symbol information"""
         data = await self._request('GET', '/fapi/v1/exchangeInfo')
         
-        for symbol_data in data['symbols']:
-            if symbol_data['symbol'] == self.symbol:
-                self.symbol_info = symbol_data
-                break
+        self.symbols_by_name = {s['symbol']: s for s in data['symbols']}
+        self.symbol_info = self.symbols_by_name.get(self.symbol)
         
         if not self.symbol_info:
             raise ValueError(f"Symbol {self.symbol} not found")
         
+        for filter_data in self.symbol_info.get('filters', []):
+            if filter_data['filterType'] == 'LOT_SIZE':
+                self._step_size, self._qty_precision = self._step_and_precision(filter_data['stepSize'])
+            elif filter_data['filterType'] == 'PRICE_FILTER':
+                self._tick_size, self._price_precision = self._step_and_precision(filter_data['tickSize'])
+        
         self.logger.info(f"Symbol info loaded for {self.symbol}")
     
     async def _set_leverage(self, symbol: str, leverage: int):
@@ -299,31 +377,23 @@ class BinanceClient:
             # May fail if already set
             self.logger.debug(f"Margin mode set failed (may already be set): {e}")
     
+    @staticmethod
+    def _step_and_precision(step: str) -> Tuple[float, int]:
+        """Parse an exchange step string, e.g. '0.00100000' -> (0.001, 3)"""
+        exponent = Decimal(step).normalize().as_tuple().exponent
+        return float(step), max(0, -exponent)
+    
     def _round_quantity(self, quantity: float) -> float:
         """Round quantity to symbol precision"""
-        if not self.symbol_info:
-            return round(quantity, 3)
-        
-        for filter_data in self.symbol_info.get('filters', []):
-            if filter_data['filterType'] == 'LOT_SIZE':
-                step_size = float(filter_data['stepSize'])
-                precision = len(str(step_size).rstrip('0').split('.')[-1])
-                return round(quantity - (quantity % step_size), precision)
-        
-        return round(quantity, 3)
+        if self._step_size is None:
+            return round(quantity, self._qty_precision)
+        return round(quantity - (quantity % self._step_size), self._qty_precision)
     
     def _round_price(self, price: float) -> float:
         """Round price to symbol precision"""
-        if not self.symbol_info:
-            return round(price, 2)
-        
-        for filter_data in self.symbol_info.get('filters', []):
-            if filter_data['filterType'] == 'PRICE_FILTER':
-                tick_size = float(filter_data['tickSize'])
-                precision = len(str(tick_size).rstrip('0').split('.')[-1])
-                return round(price - (price % tick_size), precision)
-        
-        return round(price, 2)
+        if self._tick_size is None:
+            return round(price, self._price_precision)
+        return round(price - (price % self._tick_size), self._price_precision)
     
     async def get_account_balance(self) -> Dict:
         """Get account balance and available margin"""
@@ -334,13 +404,19 @@ class BinanceClient:
                 'unrealized_pnl': 0.0
             }
         
+        now = time.monotonic()
+        if self._balance_cache is not None and now < self._balance_cache[0]:
+            return self._balance_cache[1]
+        
         data = await self._request('GET', '/fapi/v2/account', signed=True)
         
-        return {
+        balance = {
             'total_equity': float(data['totalWalletBalance']),
             'available_margin': float(data['availableBalance']),
             'unrealized_pnl': float(data['totalUnrealizedProfit'])
         }
+        self._balance_cache = (now + self.balance_cache_ttl, balance)
+        return balance
     
     async def get_current_price(self, symbol: str) -> float:
         """Get current market price"""
@@ -380,7 +456,7 @@ class BinanceClient:
         quantity = self._round_quantity(quantity)
         
         if self.dry_run:
-            order_id = int(time.time() * 1000)
+            order_id = time.time_ns() // 1_000_000
             self.logger.info(
                 f"[DRY RUN] {side.value} {quantity} {self.symbol} @ MARKET"
             )
@@ -401,6 +477,9 @@ class BinanceClient:
             await self._save_order_state(order_state)
             return order_state
         
+        # Margin changes with the fill, so the next balance read must hit the API
+        self._balance_cache = None
+        
         try:
             params = {
                 'symbol': self.symbol,
@@ -423,18 +502,16 @@ class BinanceClient:
             order_state = OrderState(
                 order_id=int(data['orderId']),
                 symbol=data['symbol'],
-                side=OrderSide[data['side']],
-                type=OrderType[data['type']],
+                side=_SIDE[data['side']],
+                type=_TYPE[data['type']],
                 quantity=float(data['origQty']),
                 price=float(data.get('price', 0)),
-                status=OrderStatus[data['status']],
+                status=_STATUS[data['status']],
                 filled_qty=float(data.get('executedQty', 0)),
                 avg_price=float(data.get('avgPrice', 0)),
                 timestamp=time.time()
             )
             
-            await self._save_order_state(order_state)
-            
             self.logger.info(
                 f"Order placed: {order_state.order_id} - {side.value} {quantity} {self.symbol}"
             )
@@ -444,13 +521,14 @@ class BinanceClient:
                 sl_order = await self._place_stop_loss(order_state, stop_loss)
                 if sl_order:
                     order_state.stop_loss_order_id = sl_order.order_id
-                    await self._save_order_state(order_state)
             
             if take_profit:
                 tp_order = await self._place_take_profit(order_state, take_profit)
                 if tp_order:
                     order_state.take_profit_order_id = tp_order.order_id
-                    await self._save_order_state(order_state)
+            
+            # Persist the parent once, with whichever bracket legs were placed
+            await self._save_order_state(order_state)
             
             return order_state
             
@@ -481,11 +559,13 @@ class BinanceClient:
             order_state = OrderState(
                 order_id=int(data['orderId']),
                 symbol=data['symbol'],
-                side=OrderSide[data['side']],
+                side=_SIDE[data['side']],
                 type=OrderType.STOP_MARKET,
                 quantity=float(data['origQty']),
                 price=float(data.get('stopPrice', 0)),
-                status=OrderStatus[data['status']],
+                status=_STATUS[data['status']],
+                filled_qty=float(data.get('executedQty', 0)),
+                avg_price=float(data.get('avgPrice', 0)),
                 timestamp=time.time()
             )
             
@@ -521,11 +601,13 @@ class BinanceClient:
             order_state = OrderState(
                 order_id=int(data['orderId']),
                 symbol=data['symbol'],
-                side=OrderSide[data['side']],
+                side=_SIDE[data['side']],
                 type=OrderType.TAKE_PROFIT_MARKET,
                 quantity=float(data['origQty']),
                 price=float(data.get('stopPrice', 0)),
-                status=OrderStatus[data['status']],
+                status=_STATUS[data['status']],
+                filled_qty=float(data.get('executedQty', 0)),
+                avg_price=float(data.get('avgPrice', 0)),
                 timestamp=time.time()
             )
             
@@ -554,11 +636,11 @@ class BinanceClient:
             order_state = OrderState(
                 order_id=int(data['orderId']),
                 symbol=data['symbol'],
-                side=OrderSide[data['side']],
-                type=OrderType[data['type']],
+                side=_SIDE[data['side']],
+                type=_TYPE[data['type']],
                 quantity=float(data['origQty']),
                 price=float(data.get('price', 0)),
-                status=OrderStatus[data['status']],
+                status=_STATUS[data['status']],
                 filled_qty=float(data.get('executedQty', 0)),
                 avg_price=float(data.get('avgPrice', 0)),
                 timestamp=time.time()
@@ -610,11 +692,11 @@ class BinanceClient:
                 order_state = OrderState(
                     order_id=int(order_data['orderId']),
                     symbol=order_data['symbol'],
-                    side=OrderSide[order_data['side']],
-                    type=OrderType[order_data['type']],
+                    side=_SIDE[order_data['side']],
+                    type=_TYPE[order_data['type']],
                     quantity=float(order_data['origQty']),
                     price=float(order_data.get('price', 0)),
-                    status=OrderStatus[order_data['status']],
+                    status=_STATUS[order_data['status']],
                     filled_qty=float(order_data.get('executedQty', 0)),
                     avg_price=float(order_data.get('avgPrice', 0)),
                     timestamp=time.time()
@@ -629,95 +711,73 @@ class BinanceClient:
             return []
     
     async def _save_order_state(self, order: OrderState):
-        """Save order state to database"""
-        async with aiosqlite.connect(self.order_db_path) as db:
-            await db.execute('''
-                INSERT OR REPLACE INTO orders
-                (order_id, symbol, side, type, quantity, price, status, 
-                 filled_qty, avg_price, timestamp, stop_loss_order_id, take_profit_order_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                order.order_id, order.symbol, order.side.value, order.type.value,
-                order.quantity, order.price, order.status.value,
-                order.filled_qty, order.avg_price, order.timestamp,
-                order.stop_loss_order_id, order.take_profit_order_id
-            ))
-            await db.commit()
+        """Queue order state for the background writer"""
+        # Snapshot the row now; callers keep mutating the OrderState afterwards
+        self._write_queue.put_nowait((
+            order.order_id, order.symbol, order.side.value, order.type.value,
+            order.quantity, order.price, order.status.value,
+            order.filled_qty, order.avg_price, order.timestamp,
+            order.stop_loss_order_id, order.take_profit_order_id
+        ))
+    
+    async def _writer_loop(self):
+        """Drain queued order rows and commit each batch in one transaction"""
+        while True:
+            rows = [await self._write_queue.get()]
+            while len(rows) < self._WRITE_BATCH_SIZE and not self._write_queue.empty():
+                rows.append(self._write_queue.get_nowait())
+            
+            try:
+                await self.db.executemany(self._INSERT_ORDER_SQL, rows)
+                await self.db.commit()
+            except Exception as e:
+                self.logger.error(f"Failed to persist {len(rows)} order states: {e}")
+            finally:
+                for _ in rows:
+                    self._write_queue.task_done()
+    
+    async def flush(self):
+        """Wait until every queued order state has been committed"""
+        # Without a running writer (before initialize(), or after it died) nothing
+        # drains the queue, and join() would wait forever
+        if self._writer_task and not self._writer_task.done():
+            await self._write_queue.join()
     
     async def _load_order_state(self, order_id: int) -> Optional[OrderState]:
         """Load order state from database"""
-        async with aiosqlite.connect(self.order_db_path) as db:
-            async with db.execute(
-                'SELECT * FROM orders WHERE order_id = ?',
-                (order_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                if not row:
-                    return None
-                
-                return OrderState(
-                    order_id=row[0],
-                    symbol=row[1],
-                    side=OrderSide[row[2]],
-                    type=OrderType[row[3]],
-                    quantity=row[4],
-                    price=row[5],
-                    status=OrderStatus[row[6]],
-                    filled_qty=row[7],
-                    avg_price=row[8],
-                    timestamp=row[9],
-                    stop_loss_order_id=row[10],
-                    take_profit_order_id=row[11]
-                )
+        # Read-your-writes: flush anything still queued first
+        await self.flush()
+        
+        async with self.db.execute(self._SELECT_ORDER_SQL, (order_id,)) as cursor:
+            row = await cursor.fetchone()
+            if not row:
+                return None
+            
+            return OrderState(
+                order_id=row[0],
+                symbol=row[1],
+                side=_SIDE[row[2]],
+                type=_TYPE[row[3]],
+                quantity=row[4],
+                price=row[5],
+                status=_STATUS[row[6]],
+                filled_qty=row[7],
+                avg_price=row[8],
+                timestamp=row[9],
+                stop_loss_order_id=row[10],
+                take_profit_order_id=row[11]
+            )
     
     async def close(self):
         """Cleanup resources"""
         if self.session:
             await self.session.close()
+            self.session = None
+        if self._writer_task:
+            await self.flush()
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self.db:
+            await self.db.close()
+            self.db = None
         self.logger.info("BinanceClient closed")
-    
-    async def _place_stop_loss(self, symbol: str, side: str, quantity: float, stop_price: float):
-        try:
-            stop_side = 'SELL' if side == 'BUY' else 'BUY'
-            
-            order = await asyncio.to_thread(
-                self.client.futures_create_order,
-                symbol=symbol,
-                side=stop_side,
-                type='STOP_MARKET',
-                stopPrice=stop_price,
-                quantity=quantity
-            )
-            
-            self.logger.info(f"Stop loss placed at {stop_price}: {order['orderId']}")
-            
-        except Exception as e:
-            self.logger.error(f"Error placing stop loss: {e}")
-    
-    async def _place_take_profit(self, symbol: str, side: str, quantity: float, take_profit_price: float):
-        try:
-            tp_side = 'SELL' if side == 'BUY' else 'BUY'
-            
-            order = await asyncio.to_thread(
-                self.client.futures_create_order,
-                symbol=symbol,
-                side=tp_side,
-                type='TAKE_PROFIT_MARKET',
-                stopPrice=take_profit_price,
-                quantity=quantity
-            )
-            
-            self.logger.info(f"Take profit placed at {take_profit_price}: {order['orderId']}")
-            
-        except Exception as e:
-            self.logger.error(f"Error placing take profit: {e}")
-    
-    async def get_order_status(self, symbol: str, order_id: int) -> Dict:
-        """Legacy method for backward compatibility - use get_order_status(order_id) instead"""
-        self.logger.warning("Deprecated method called: get_order_status(symbol, order_id)")
-        return await self.get_order_status(order_id)
-    
-    async def close(self):
-        """Legacy method for backward compatibility"""
-        self.logger.info("Closing Binance client")
-
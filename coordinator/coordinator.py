@@ -1,19 +1,28 @@
 import asyncio
+import copy
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 import yaml
 import signal
 import time
 import psutil
+import aiohttp
+import orjson
+from aiohttp import web
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 
-from binance_client import BinanceClient, OrderSide, OrderType
+from binance_client import BinanceClient, OrderSide, OrderState, OrderType
 from ensemble import EnsembleAggregator
-from risk_manager import RiskManager
+from risk_manager import RiskManager, RiskMetrics
 from data_logger import DataLogger
 from market_data import MarketDataCollector
+from api_server import DashboardAPIServer
 
 try:
     from telegram_alerts import initialize_alerter, get_alerter, close_alerter
@@ -23,7 +32,7 @@ except ImportError:
     logging.warning("telegram_alerts not available")
 
 try:
-    from prometheus_client import Counter, Gauge, Histogram, start_http_server
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
     PROMETHEUS_AVAILABLE = True
 except ImportError:
     PROMETHEUS_AVAILABLE = False
@@ -37,12 +46,101 @@ except ImportError:
     logging.warning("websockets not installed, WebSocket server disabled")
 
 
+_TIMEFRAME_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def _timeframe_seconds(timeframe: str) -> Optional[int]:
+    """
+    Convert a Binance kline interval such as '5m' or '1h' to seconds. Returns None
+    for intervals without a fixed length ('1M') or that don't parse.
+    """
+    unit = _TIMEFRAME_UNITS.get(timeframe[-1:])
+    if unit is None or not timeframe[:-1].isdigit():
+        return None
+    return int(timeframe[:-1]) * unit
+
+
+@dataclass(slots=True, frozen=True)
+class TimingConfig:
+    heartbeat_interval: float = 60
+    health_check_interval: float = 300
+    candle_interval: float = 300
+    candle_close_delay: float = 0.2
+
+
+@dataclass(slots=True, frozen=True)
+class TradingConfig:
+    symbol: str = 'BTCUSDT'
+    leverage: int = 1
+    max_open_positions: int = 1
+
+
+@dataclass(slots=True, frozen=True)
+class SafetyConfig:
+    close_positions_on_shutdown: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class CoordinatorConfig:
+    """Typed view of the config values the coordinator reads on its hot paths"""
+    dry_run: bool
+    testnet: bool
+    timing: TimingConfig
+    trading: TradingConfig
+    safety: SafetyConfig
+    
+    @staticmethod
+    def _section(section_cls, raw: Dict):
+        return section_cls(**{name: raw[name] for name in section_cls.__slots__ if name in raw})
+    
+    @classmethod
+    def from_dict(cls, config: Dict) -> 'CoordinatorConfig':
+        timing = cls._section(TimingConfig, config.get('timing', {}))
+        if 'candle_interval' not in config.get('timing', {}):
+            # Decisions follow the primary (first) data timeframe
+            timeframes = config.get('data', {}).get('timeframes', ['5m'])
+            candle_interval = _timeframe_seconds(timeframes[0])
+            timing = replace(timing, candle_interval=candle_interval or timing.heartbeat_interval)
+        
+        return cls(
+            dry_run=config.get('dry_run', True),
+            testnet=config.get('testnet', True),
+            timing=timing,
+            trading=cls._section(TradingConfig, config.get('trading', {})),
+            safety=cls._section(SafetyConfig, config.get('safety', {}))
+        )
+
+
+# (abspath, mtime_ns, size) -> parsed config, for repeated loads in one process
+_CONFIG_MEMO: Dict[Tuple[str, int, int], Dict] = {}
+
+# Shared, never-mutated stand-in for absent status sections
+_EMPTY_SECTION: Dict = {}
+
+
+def _noop(*args, **kwargs):
+    """Stand-in for metric updates when Prometheus is unavailable"""
+
+
+@dataclass(slots=True)
+class OpenTrade:
+    """An entry the coordinator has placed and is tracking"""
+    trade_id: int
+    order_state: OrderState
+    decision: Dict
+    snapshot_id: int
+    entry_time: float
+    entry_price: float
+    quantity: float
+    side: str
+
+
 class TradingCoordinator:
     """
     Production-grade trading coordinator with async heartbeat
     
     Features:
-    - Async 60-second heartbeat loop
+    - Async decision loop aligned to candle closes
     - Ensemble aggregation with Bayesian fusion
     - Risk management with Kelly criterion
     - Circuit breaker and position limits
@@ -52,6 +150,9 @@ class TradingCoordinator:
     - Complete data logging with schema v2
     """
     
+    _PREDICTION_CACHE_SIZE = 1024
+    _WS_SEND_QUEUE_SIZE = 64
+    
     def __init__(self, config_path: str = "config.yaml", config_dict: Optional[Dict] = None):
         """
         Initialize coordinator with either config file path or config dict
@@ -64,6 +165,7 @@ class TradingCoordinator:
             self.config = config_dict
         else:
             self.config = self._load_config(config_path)
+        self.cfg = CoordinatorConfig.from_dict(self.config)
         
         self._setup_logging()
         
@@ -77,17 +179,64 @@ class TradingCoordinator:
         self.data_logger = DataLogger(self.config)
         self.market_data = MarketDataCollector(self.config)
         
+        # Shared HTTP session for model server traffic, created in start()
+        self.http: Optional[aiohttp.ClientSession] = None
+        
+        # Dashboard REST API, served from its own thread once started
+        self.api_server: Optional[DashboardAPIServer] = None
+        # Prometheus /metrics endpoint, served on this loop once started
+        self._metrics_runner: Optional[web.AppRunner] = None
+        
         # State management
         self.is_running = False
+        self._stop_event = asyncio.Event()  # Set on shutdown; wakes every loop's sleep
         self.current_position = None
-        self.open_trades = {}  # trade_id -> trade_info
+        self.open_trades: Dict[int, OpenTrade] = {}
         self.circuit_breaker_alerted = False  # Track if we've alerted about circuit breaker
         
+        # LRU of model responses keyed by quantized snapshot features
+        self._prediction_cache_enabled = self.config.get('ensemble', {}).get('cache_enabled', False)
+        self._prediction_cache: OrderedDict = OrderedDict()  # key -> (expires_at, model_responses)
+        
         # Metrics
         self._init_metrics()
         
-        # WebSocket clients
-        self.ws_clients = set()
+        # Reused for status CPU/memory; the first cpu_percent() call only primes it
+        self._process = psutil.Process()
+        self._process.cpu_percent(interval=None)
+        
+        # WebSocket clients -> their bounded outgoing message queue
+        self.ws_clients: Dict = {}
+        
+        # Status broadcast payload, allocated once and refreshed in place per update
+        self._status_market: Dict = {}
+        self._status_decision: Dict = {}
+        self._status_buf: Dict = {
+            'type': 'status_update',
+            'timestamp': None,
+            'coordinator': {
+                'status': 'stopped',
+                'dry_run': self.cfg.dry_run,
+                'testnet': self.cfg.testnet,
+                'symbol': self.cfg.trading.symbol,
+                'uptime_seconds': 0,
+                'websocket_clients': 0,
+                'open_trades': 0,
+                'circuit_breaker': 'normal',
+                'cpu_usage': 0.0,
+                'memory_usage': 0.0
+            },
+            'models': [],
+            'market': _EMPTY_SECTION,
+            'decision': _EMPTY_SECTION,
+            # Performance metrics
+            'performance': {
+                'total_pnl': 0,  # TODO: Get from data logger
+                'daily_pnl': 0,
+                'win_rate': 0,
+                'total_trades': 0,
+            }
+        }
         
         self.logger.info("Trading Coordinator initialized")
     
@@ -95,6 +244,9 @@ class TradingCoordinator:
         """Initialize Prometheus metrics"""
         if not PROMETHEUS_AVAILABLE:
             self.metrics = None
+            # Per-cycle metric updates are bound callables, so the loop never branches
+            self._inc_snapshots = self._observe_decision_latency = _noop
+            self._set_circuit_breaker = self._count_decision = _noop
             return
         
         self.metrics = {
@@ -110,21 +262,76 @@ class TradingCoordinator:
             'circuit_breaker_active': Gauge('xylen_circuit_breaker', 'Circuit breaker status'),
         }
         
-        # Start Prometheus HTTP server
+        # Bound (model, action) children so the decision cycle skips .labels() lookups
+        predictions = self.metrics['model_predictions']
+        self._model_pred_counters = {
+            (endpoint['name'], action): predictions.labels(model=endpoint['name'], action=action)
+            for endpoint in self.config.get('model_endpoints', [])
+            for action in ('long', 'short', 'hold')
+        }
+        decisions = self.metrics['ensemble_decisions']
+        self._decision_counters = {
+            (action, result): decisions.labels(action=action, result=result)
+            for action in ('long', 'short', 'hold')
+            for result in ('approved', 'rejected')
+        }
+        
+        orders = self.metrics['orders_placed']
+        self._orders_placed_counters = {
+            (side, status): orders.labels(side=side, status=status)
+            for side in ('BUY', 'SELL')
+            for status in ('success', 'failed')
+        }
+        
+        self._inc_snapshots = self.metrics['snapshots_collected'].inc
+        self._observe_decision_latency = self.metrics['decision_latency'].observe
+        self._set_circuit_breaker = self.metrics['circuit_breaker_active'].set
+        self._count_decision = self._inc_decision_counter
+    
+    def _inc_decision_counter(self, action: str, result: str):
+        counter = self._decision_counters.get((action, result))
+        if counter is None:
+            counter = self._decision_counters[(action, result)] = self.metrics['ensemble_decisions'].labels(
+                action=action,
+                result=result
+            )
+        counter.inc()
+    
+    async def _start_metrics_server(self):
+        """Serve /metrics from the coordinator's own event loop instead of a server thread"""
         metrics_port = self.config.get('monitoring', {}).get('prometheus_port', 9090)
+        
+        async def metrics_handler(request):
+            return web.Response(body=generate_latest(), headers={'Content-Type': CONTENT_TYPE_LATEST})
+        
+        app = web.Application()
+        app.router.add_get('/metrics', metrics_handler)
+        self._metrics_runner = web.AppRunner(app, access_log=None)
         try:
-            start_http_server(metrics_port)
+            await self._metrics_runner.setup()
+            await web.TCPSite(self._metrics_runner, '0.0.0.0', metrics_port).start()
             self.logger.info(f"Prometheus metrics server started on port {metrics_port}")
         except Exception as e:
             self.logger.warning(f"Failed to start Prometheus server: {e}")
-        
+    
     def _load_config(self, config_path: str) -> Dict:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Config file not found: {config_path}")
         
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Same file, unchanged since it was last parsed in this process: hand out a
+        # copy of the memoized result so callers can't mutate each other's config
+        st = os.stat(config_path)
+        memo_key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+        config = _CONFIG_MEMO.get(memo_key)
+        if config is not None:
+            return copy.deepcopy(config)
+        
+        # Binary stream straight into the libyaml-backed loader when available; it
+        # detects the encoding itself, skipping Python's text-mode decoding
+        with open(config_path, 'rb') as f:
+            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         
+        _CONFIG_MEMO[memo_key] = copy.deepcopy(config)
         return config
     
     def _setup_logging(self):
@@ -134,20 +341,52 @@ class TradingCoordinator:
         
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
         
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=log_config.get('max_bytes', 10485760),
+            backupCount=log_config.get('backup_count', 10),
+            delay=True
+        )
+        stream_handler = logging.StreamHandler(sys.stdout)
+        for handler in (file_handler, stream_handler):
+            handler.setFormatter(formatter)
+        
+        # The event loop only enqueues records; a listener thread does the disk/stdout writes
+        log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
         )
+        self._log_listener.start()
+        
+        # Pass the bare message through; the listener's handlers apply the real format
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        logging.basicConfig(level=log_level, handlers=[self._queue_handler])
+    
+    def _stop_log_listener(self):
+        """
+        Drain queued records and hand the file/stdout handlers back to the root
+        logger, so teardown messages logged after shutdown still get written
+        """
+        if self._log_listener is None:
+            return
+        
+        root = logging.getLogger()
+        attached = self._queue_handler in root.handlers
+        root.removeHandler(self._queue_handler)
+        self._log_listener.stop()
+        if attached:
+            for handler in self._log_listener.handlers:
+                root.addHandler(handler)
+        self._log_listener = None
     
     async def start(self):
         """Start coordinator with all subsystems"""
         self.logger.info("Starting Trading Coordinator")
-        self.logger.info(f"Dry Run Mode: {self.config.get('dry_run', True)}")
-        self.logger.info(f"Testnet Mode: {self.config.get('testnet', True)}")
+        self.logger.info(f"Dry Run Mode: {self.cfg.dry_run}")
+        self.logger.info(f"Testnet Mode: {self.cfg.testnet}")
         
         # Log system event
         await self.data_logger.log_system_event(
@@ -156,77 +395,162 @@ class TradingCoordinator:
             component='coordinator',
             message='Trading Coordinator starting',
             details={
-                'dry_run': self.config.get('dry_run', True),
-                'testnet': self.config.get('testnet', True),
-                'symbol': self.config.get('trading', {}).get('symbol', 'BTCUSDT')
+                'dry_run': self.cfg.dry_run,
+                'testnet': self.cfg.testnet,
+                'symbol': self.cfg.trading.symbol
             }
         )
         
-        # Initialize components
+        # Shutdown runs however startup ends, so a failed initialization still
+        # releases whatever was brought up before it (sessions, writer tasks, API thread)
+        tasks = []
         try:
-            await self.market_data.initialize()
-            await self.data_logger.initialize()
-            await self.binance_client.initialize()
-            # RiskManager doesn't need async initialization
+            # Initialize components
+            try:
+                self.http = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=75),
+                    headers={'Connection': 'keep-alive'}
+                )
+                self.ensemble.set_session(self.http)
+                
+                # Independent connections and handshakes; RiskManager needs no async setup
+                await asyncio.gather(
+                    self.market_data.initialize(),
+                    self.data_logger.initialize(),
+                    self.binance_client.initialize()
+                )
+                
+                # Percent-based loss limits are measured against the real starting equity
+                balance = await self.binance_client.get_account_balance()
+                self.risk_manager.update_initial_equity(balance['total_equity'])
+                
+                if self.metrics:
+                    await self._start_metrics_server()
+                
+                # Initialize telegram alerts
+                if TELEGRAM_AVAILABLE:
+                    await initialize_alerter(self.config)
+                
+                dashboard_config = self.config.get('dashboard', {})
+                if dashboard_config.get('enabled', False):
+                    self.api_server = DashboardAPIServer(
+                        self,
+                        port=dashboard_config.get('port', 5500),
+                        host=dashboard_config.get('host', '0.0.0.0')
+                    )
+                    await self.api_server.start_in_thread()
+                
+                self.logger.info("All components initialized successfully")
+            except Exception as e:
+                self.logger.error(f"Failed to initialize components: {e}", exc_info=True)
+                await self.data_logger.log_system_event(
+                    event_type='INIT_ERROR',
+                    severity='CRITICAL',
+                    component='coordinator',
+                    message=f'Initialization failed: {e}'
+                )
+                return
             
-            # Initialize telegram alerts
-            if TELEGRAM_AVAILABLE:
-                await initialize_alerter(self.config)
+            self.is_running = True
+            self.start_time = time.monotonic()  # Track uptime; immune to wall-clock steps
             
-            self.logger.info("All components initialized successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize components: {e}", exc_info=True)
-            await self.data_logger.log_system_event(
-                event_type='INIT_ERROR',
-                severity='CRITICAL',
-                component='coordinator',
-                message=f'Initialization failed: {e}'
-            )
-            return
-        
-        self.is_running = True
-        self.start_time = time.time()  # Track uptime
-        
-        # Start async tasks
-        tasks = [
-            asyncio.create_task(self._main_loop(), name="main_loop"),
-            asyncio.create_task(self._health_check_loop(), name="health_check"),
-        ]
-        
-        # Start WebSocket server if available
-        if WEBSOCKETS_AVAILABLE and self.config.get('dashboard', {}).get('websocket_enabled', True):
-            tasks.append(asyncio.create_task(self._websocket_server(), name="websocket"))
-        
-        try:
-            await asyncio.gather(*tasks)
+            # Start async tasks
+            tasks = [
+                asyncio.create_task(self._main_loop(), name="main_loop"),
+                asyncio.create_task(self._health_check_loop(), name="health_check"),
+            ]
+            
+            # Start WebSocket server if available
+            if WEBSOCKETS_AVAILABLE and self.config.get('dashboard', {}).get('websocket_enabled', True):
+                tasks.append(asyncio.create_task(self._websocket_server(), name="websocket"))
+            
+            # Supervise the loops: the first one to crash takes the others down with it
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.cancelled() or task.exception() is None:
+                    continue
+                e = task.exception()
+                self.logger.error(f"Error in coordinator task {task.get_name()}: {e}", exc_info=e)
+                await self.data_logger.log_system_event(
+                    event_type='RUNTIME_ERROR',
+                    severity='ERROR',
+                    component=task.get_name(),
+                    message=f'Runtime error: {e}'
+                )
         except asyncio.CancelledError:
             self.logger.info("Coordinator tasks cancelled")
-        except Exception as e:
-            self.logger.error(f"Error in coordinator: {e}", exc_info=True)
-            await self.data_logger.log_system_event(
-                event_type='RUNTIME_ERROR',
-                severity='ERROR',
-                component='coordinator',
-                message=f'Runtime error: {e}'
-            )
+            raise
         finally:
+            for task in tasks:
+                task.cancel()
+            # Let every loop finish unwinding before components are closed under it
+            await asyncio.gather(*tasks, return_exceptions=True)
             await self.shutdown()
+
+    @property
+    def daily_stats(self) -> Dict:
+        """Today's trade count and PnL, as reported by the dashboard API"""
+        return {
+            'trades': self.risk_manager.daily_trade_count,
+            'pnl': self.risk_manager.daily_pnl,
+            'start_time': datetime.utcfromtimestamp(self.risk_manager.daily_reset_time)
+        }
+    
+    def request_stop(self):
+        """Stop all loops; their pending sleeps return immediately"""
+        self.is_running = False
+        self._stop_event.set()
+    
+    async def _sleep(self, seconds: float):
+        """Sleep that ends early once a stop is requested"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+    
+    def _seconds_to_next_tick(self, interval: float) -> float:
+        """
+        Seconds until the next multiple of `interval` on the epoch grid. Sleeping to
+        absolute grid points keeps slow cycles from pushing later ones back, and a
+        cycle that overran its slot simply lands on the following one.
+        """
+        delay = interval - (time.time() % interval)
+        # The sleep runs on the loop's monotonic clock, so it can end a hair before the
+        # wall-clock boundary; skip that sliver rather than run the same slot twice
+        if delay < self.cfg.timing.candle_close_delay:
+            delay += interval
+        return delay
+    
+    def _seconds_to_next_candle(self) -> float:
+        """Seconds until just after the next primary candle closes"""
+        return self._seconds_to_next_tick(self.cfg.timing.candle_interval) + self.cfg.timing.candle_close_delay
+    
+    def _next_cycle_delay(self) -> float:
+        """
+        Flat entry: wake right after the next candle close, when new data exists.
+        Open position: keep the heartbeat cadence so it is monitored mid-candle.
+        """
+        if self.open_trades:
+            return self._seconds_to_next_tick(self.cfg.timing.heartbeat_interval)
+        return self._seconds_to_next_candle()
     
     async def _main_loop(self):
-        """Main heartbeat loop - executes every 60 seconds"""
-        heartbeat_interval = self.config.get('timing', {}).get('heartbeat_interval', 60)
+        """Main loop - runs a decision cycle at each candle close"""
+        heartbeat_interval = self.cfg.timing.heartbeat_interval
         
-        self.logger.info(f"Main loop started with {heartbeat_interval}s heartbeat")
+        self.logger.info(
+            f"Main loop started: {self.cfg.timing.candle_interval:.0f}s candles, "
+            f"{heartbeat_interval}s heartbeat while positions are open"
+        )
         
         while self.is_running:
-            cycle_start = time.time()
+            cycle_start = time.perf_counter()
             
             try:
                 # Check circuit breaker
                 if self.risk_manager.circuit_breaker_active():
                     self.logger.warning("Circuit breaker active, skipping trading cycle")
-                    if self.metrics:
-                        self.metrics['circuit_breaker_active'].set(1)
+                    self._set_circuit_breaker(1)
                     
                     # Send alert on first detection
                     if not self.circuit_breaker_alerted and TELEGRAM_AVAILABLE:
@@ -245,28 +569,26 @@ class TradingCoordinator:
                         except Exception as e:
                             self.logger.warning(f"Failed to send circuit breaker alert: {e}")
                     
-                    await asyncio.sleep(heartbeat_interval)
+                    await self._sleep(self._seconds_to_next_tick(heartbeat_interval))
                     continue
                 
                 # Reset alert flag when circuit breaker clears
                 if self.circuit_breaker_alerted:
                     self.circuit_breaker_alerted = False
                 
-                if self.metrics:
-                    self.metrics['circuit_breaker_active'].set(0)
+                self._set_circuit_breaker(0)
                 
                 # Execute decision cycle
                 await self._decision_cycle()
                 
                 # Record cycle latency
-                cycle_duration = time.time() - cycle_start
-                if self.metrics:
-                    self.metrics['decision_latency'].observe(cycle_duration)
+                cycle_duration = time.perf_counter() - cycle_start
+                self._observe_decision_latency(cycle_duration)
                 
-                self.logger.debug(f"Decision cycle completed in {cycle_duration:.2f}s")
+                self.logger.debug("Decision cycle completed in %.2fs", cycle_duration)
                 
-                # Wait for next heartbeat
-                await asyncio.sleep(heartbeat_interval)
+                # Wait for next candle close (or heartbeat while in a position)
+                await self._sleep(self._next_cycle_delay())
                 
             except Exception as e:
                 self.logger.error(f"Error in main loop: {e}", exc_info=True)
@@ -276,7 +598,7 @@ class TradingCoordinator:
                     component='main_loop',
                     message=f'Main loop error: {e}'
                 )
-                await asyncio.sleep(heartbeat_interval)
+                await self._sleep(heartbeat_interval)
     
     async def _decision_cycle(self):
         """
@@ -289,65 +611,67 @@ class TradingCoordinator:
         6. Log all data
         """
         try:
-            # Step 1: Collect market snapshot
-            snapshot = await self.market_data.get_snapshot()
-            
-            if self.metrics:
-                self.metrics['snapshots_collected'].inc()
+            # Step 1: Collect market snapshot, fetching account balance alongside it
+            snapshot, balance = await asyncio.gather(
+                self.market_data.get_snapshot(),
+                self.binance_client.get_account_balance()
+            )
             
-            # Log snapshot to database
-            snapshot_id = await self.data_logger.log_snapshot(snapshot)
+            self._inc_snapshots()
             
-            self.logger.info(f"Snapshot collected: price={snapshot.get('current_price'):.2f}, "
-                           f"RSI={snapshot.get('indicators', {}).get('rsi', 0):.1f}")
+            # Missing values must not turn this log line into a failed cycle
+            if self.logger.isEnabledFor(logging.INFO):
+                price = snapshot.get('current_price')
+                rsi = snapshot.get('indicators', {}).get('rsi')
+                self.logger.info(
+                    "Snapshot collected: price=%s, RSI=%s",
+                    f"{price:.2f}" if isinstance(price, (int, float)) else 'N/A',
+                    f"{rsi:.1f}" if isinstance(rsi, (int, float)) else 'N/A'
+                )
             
-            # Step 2: Query model servers
-            model_responses = await self.ensemble.get_model_predictions(snapshot)
+            # Step 2: Query model servers while the snapshot is written to the database;
+            # the two are independent, so the cycle pays for the slower one only
+            snapshot_id, (model_responses, from_cache) = await asyncio.gather(
+                self.data_logger.log_snapshot(snapshot),
+                self._query_models(snapshot)
+            )
             
             if not model_responses:
                 self.logger.warning("No model responses received")
                 return
             
-            # Log individual predictions
-            for response in model_responses:
-                model_name = response.get('model_name', 'unknown')
-                action = response.get('action', 'hold')
-                confidence = response.get('confidence', 0)
-                
-                await self.data_logger.log_model_prediction(
-                    model_name=model_name,
-                    snapshot_id=snapshot_id,
-                    action=action,
-                    confidence=confidence,
-                    probability=response.get('probability'),
-                    expected_return=response.get('expected_return'),
-                    latency_ms=response.get('latency_ms'),
-                    raw_response=response
-                )
-                
-                if self.metrics:
-                    self.metrics['model_predictions'].labels(
-                        model=model_name,
-                        action=action
-                    ).inc()
+            # Reused responses were already recorded under the snapshot that produced
+            # them; logging them again would double-count them in model accuracy stats
+            if not from_cache:
+                # Queue all predictions in one call; the data logger batches them into one commit
+                await self.data_logger.log_model_predictions(snapshot_id, model_responses)
+            
+            if self.metrics and not from_cache:
+                for response in model_responses:
+                    key = (response.get('model_name', 'unknown'), response.get('action', 'hold'))
+                    counter = self._model_pred_counters.get(key)
+                    if counter is None:
+                        counter = self._model_pred_counters[key] = self.metrics['model_predictions'].labels(
+                            model=key[0],
+                            action=key[1]
+                        )
+                    counter.inc()
             
             # Step 3: Aggregate ensemble decision
             decision = self.ensemble.aggregate(model_responses)
             
-            self.logger.info(f"Ensemble decision: {decision['action']} "
-                           f"(confidence={decision['confidence']:.3f}, "
-                           f"expected_value={decision.get('expected_value', 0):.4f})")
+            self.logger.info("Ensemble decision: %s (confidence=%.3f, expected_value=%.4f)",
+                             decision['action'], decision['confidence'], decision.get('expected_value', 0))
             
             # Step 4: Validate with risk manager
             # Build risk metrics from current state
-            from risk_manager import RiskMetrics
             risk_metrics = RiskMetrics(
-                total_equity=10000.0,  # TODO: Get from binance account
-                available_margin=10000.0,  # TODO: Get from binance account
+                total_equity=balance['total_equity'],
+                available_margin=balance['available_margin'],
                 total_exposure=0.0,  # TODO: Calculate from open positions
                 open_positions=len(self.open_trades),
-                daily_pnl=0.0,  # TODO: Calculate from today's trades
-                daily_trades=0,  # TODO: Count from today's trades
+                daily_pnl=self.risk_manager.daily_pnl,
+                daily_trades=self.risk_manager.daily_trade_count,
                 consecutive_losses=self.risk_manager.consecutive_losses,
                 win_rate=0.5  # TODO: Calculate from historical trades
             )
@@ -357,7 +681,7 @@ class TradingCoordinator:
             position_size_obj = self.risk_manager.calculate_position_size(
                 current_price=current_price,
                 account_balance=risk_metrics.available_margin,
-                leverage=self.config.get('trading', {}).get('leverage', 1)
+                leverage=self.cfg.trading.leverage
             )
             
             # Validate trade
@@ -373,8 +697,8 @@ class TradingCoordinator:
                 'position_size': position_size_obj.size_usd if is_valid else 0
             }
             
-            # Log ensemble decision
-            await self.data_logger.log_ensemble_decision(
+            # Log ensemble decision, overlapped with order submission below
+            decision_log = asyncio.create_task(self.data_logger.log_ensemble_decision(
                 snapshot_id=snapshot_id,
                 final_action=decision['action'],
                 final_confidence=decision['confidence'],
@@ -387,13 +711,9 @@ class TradingCoordinator:
                 position_size=risk_check.get('position_size'),
                 rejected=not risk_check['approved'],
                 rejection_reason=risk_check.get('reason')
-            )
+            ))
             
-            if self.metrics:
-                self.metrics['ensemble_decisions'].labels(
-                    action=decision['action'],
-                    result='approved' if risk_check['approved'] else 'rejected'
-                ).inc()
+            self._count_decision(decision['action'], 'approved' if risk_check['approved'] else 'rejected')
             
             # Step 5: Execute trade if approved
             if risk_check['approved'] and decision['action'] in ['long', 'short']:
@@ -402,7 +722,9 @@ class TradingCoordinator:
                 if not risk_check['approved']:
                     self.logger.info(f"Trade rejected by risk manager: {risk_check.get('reason')}")
                 else:
-                    self.logger.debug(f"No trade signal (action={decision['action']})")
+                    self.logger.debug("No trade signal (action=%s)", decision['action'])
+            
+            await decision_log
             
             # Broadcast comprehensive update to WebSocket clients
             await self._broadcast_status_update(snapshot, decision, risk_check)
@@ -416,6 +738,54 @@ class TradingCoordinator:
                 message=f'Decision cycle error: {e}'
             )
     
+    async def _query_models(self, snapshot: Dict) -> Tuple[List[Dict], bool]:
+        """
+        Query model servers, unless a near-identical snapshot was just scored.
+        Returns the responses and whether they came from the cache.
+        """
+        cache_key = self._prediction_cache_key(snapshot) if self._prediction_cache_enabled else None
+        model_responses = self._cached_predictions(cache_key)
+        if model_responses is not None:
+            return model_responses, True
+        
+        model_responses = await self.ensemble.get_model_predictions(snapshot)
+        if cache_key is not None and model_responses:
+            self._store_predictions(cache_key, model_responses)
+        return model_responses, False
+    
+    @staticmethod
+    def _prediction_cache_key(snapshot: Dict) -> tuple:
+        indicators = snapshot.get('indicators', {})
+        candles = snapshot.get('candles_5m')
+        return (
+            round(float(snapshot.get('current_price', 0)), 1),
+            # Open time of the latest bar, so a new candle never reuses the last one's predictions
+            candles[-1].get('timestamp') if candles else None,
+            round(indicators.get('rsi', 0), 1),
+            round(indicators.get('ema_20', 0), 1)
+        )
+    
+    def _cached_predictions(self, key) -> Optional[List[Dict]]:
+        if key is None:
+            return None
+        
+        entry = self._prediction_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del self._prediction_cache[key]
+            return None
+        
+        self._prediction_cache.move_to_end(key)
+        return entry[1]
+    
+    def _store_predictions(self, key, model_responses: List[Dict]):
+        ttl = self.cfg.timing.heartbeat_interval * 2
+        self._prediction_cache[key] = (time.monotonic() + ttl, model_responses)
+        self._prediction_cache.move_to_end(key)
+        if len(self._prediction_cache) > self._PREDICTION_CACHE_SIZE:
+            self._prediction_cache.popitem(last=False)
+    
     async def _execute_trade(
         self,
         decision: Dict,
@@ -426,7 +796,7 @@ class TradingCoordinator:
         """Execute approved trade with position management"""
         try:
             # Check if already have open position
-            max_positions = self.config.get('trading', {}).get('max_open_positions', 1)
+            max_positions = self.cfg.trading.max_open_positions
             if len(self.open_trades) >= max_positions:
                 self.logger.info(f"Already have {len(self.open_trades)} open positions (max={max_positions})")
                 return
@@ -467,12 +837,11 @@ class TradingCoordinator:
             if not order_state:
                 self.logger.error("Order placement failed")
                 if self.metrics:
-                    self.metrics['orders_placed'].labels(
-                        side=side.value,
-                        status='failed'
-                    ).inc()
+                    self._orders_placed_counters[(side.value, 'failed')].inc()
                 return
             
+            entry_price = order_state.avg_price if order_state.avg_price > 0 else current_price
+            
             # Log order
             await self.data_logger.log_order(
                 order_id=order_state.order_id,
@@ -488,9 +857,9 @@ class TradingCoordinator:
             
             # Create trade record
             trade_id = await self.data_logger.log_trade_open(
-                symbol=self.config.get('trading', {}).get('symbol', 'BTCUSDT'),
+                symbol=self.cfg.trading.symbol,
                 side=decision['action'],
-                entry_price=order_state.avg_price if order_state.avg_price > 0 else current_price,
+                entry_price=entry_price,
                 quantity=quantity,
                 entry_order_id=order_state.order_id,
                 snapshot_id=snapshot_id,
@@ -500,32 +869,33 @@ class TradingCoordinator:
             )
             
             # Track open trade
-            self.open_trades[trade_id] = {
-                'trade_id': trade_id,
-                'order_state': order_state,
-                'decision': decision,
-                'snapshot_id': snapshot_id,
-                'entry_time': datetime.utcnow(),
-                'entry_price': order_state.avg_price if order_state.avg_price > 0 else current_price,
-                'quantity': quantity,
-                'side': decision['action']
-            }
+            self.open_trades[trade_id] = OpenTrade(
+                trade_id=trade_id,
+                order_state=order_state,
+                decision=decision,
+                snapshot_id=snapshot_id,
+                entry_time=time.time(),
+                entry_price=entry_price,
+                quantity=quantity,
+                side=decision['action']
+            )
+            
+            # Position state just changed; don't let the dashboard serve the old status
+            if self.api_server:
+                self.api_server.invalidate_cache()
             
             # Update metrics
             if self.metrics:
-                self.metrics['orders_placed'].labels(
-                    side=side.value,
-                    status='success'
-                ).inc()
+                self._orders_placed_counters[(side.value, 'success')].inc()
                 self.metrics['position_size'].set(position_size)
                 self.metrics['risk_exposure'].set(risk_check.get('total_exposure', 0))
             
             # Update risk manager state
             self.risk_manager.record_trade_entry(
-                symbol=self.config.get('trading', {}).get('symbol', 'BTCUSDT'),
+                symbol=self.cfg.trading.symbol,
                 side=decision['action'],
                 quantity=quantity,
-                entry_price=order_state.avg_price if order_state.avg_price > 0 else current_price
+                entry_price=entry_price
             )
             
             self.logger.info(f"Trade executed successfully: trade_id={trade_id}, "
@@ -538,10 +908,10 @@ class TradingCoordinator:
                     if alerter:
                         await alerter.alert_trade_opened({
                             'trade_id': trade_id,
-                            'symbol': self.config.get('trading', {}).get('symbol', 'BTCUSDT'),
+                            'symbol': self.cfg.trading.symbol,
                             'side': decision['action'],
                             'quantity': quantity,
-                            'entry_price': order_state.avg_price if order_state.avg_price > 0 else current_price,
+                            'entry_price': entry_price,
                             'stop_loss': stop_loss,
                             'take_profit': take_profit,
                             'confidence': decision['confidence'],
@@ -574,7 +944,7 @@ class TradingCoordinator:
     
     async def _health_check_loop(self):
         """Periodic health checks for model servers and system"""
-        health_check_interval = self.config.get('timing', {}).get('health_check_interval', 300)
+        health_check_interval = self.cfg.timing.health_check_interval
         
         self.logger.info(f"Health check loop started with {health_check_interval}s interval")
         
@@ -628,16 +998,16 @@ class TradingCoordinator:
                         balance = await self.binance_client.get_account_balance()
                         self.metrics['account_equity'].set(balance.get('total_equity', 0))
                     except Exception as e:
-                        self.logger.debug(f"Failed to update equity metric: {e}")
+                        self.logger.debug("Failed to update equity metric: %s", e)
                 
-                # Broadcast comprehensive status update to dashboard
-                await self._broadcast_status_update()
+                # Broadcast comprehensive status update to dashboard, reusing this pass's health results
+                await self._broadcast_status_update(model_health=health_status_list)
                 
-                await asyncio.sleep(health_check_interval)
+                await self._sleep(self._seconds_to_next_tick(health_check_interval))
                 
             except Exception as e:
                 self.logger.error(f"Error in health check loop: {e}", exc_info=True)
-                await asyncio.sleep(health_check_interval)
+                await self._sleep(self._seconds_to_next_tick(health_check_interval))
     
     async def _websocket_server(self):
         """WebSocket server for real-time dashboard updates"""
@@ -650,17 +1020,18 @@ class TradingCoordinator:
         
         async def handle_client(websocket, path):
             """Handle individual WebSocket client"""
-            self.ws_clients.add(websocket)
+            send_queue = asyncio.Queue(maxsize=self._WS_SEND_QUEUE_SIZE)
+            # Welcome message goes first, ahead of any broadcast
+            send_queue.put_nowait(orjson.dumps({
+                'type': 'welcome',
+                'timestamp': time.time(),
+                'message': 'Connected to Xylen Trading Coordinator'
+            }).decode())
+            self.ws_clients[websocket] = send_queue
+            writer = asyncio.create_task(self._ws_writer(websocket, send_queue))
             self.logger.info(f"WebSocket client connected: {websocket.remote_address}")
             
             try:
-                # Send initial welcome message
-                await websocket.send(json.dumps({
-                    'type': 'welcome',
-                    'timestamp': datetime.utcnow().isoformat(),
-                    'message': 'Connected to Xylen Trading Coordinator'
-                }))
-                
                 # Send initial comprehensive status
                 await self._broadcast_status_update()
                 
@@ -668,104 +1039,107 @@ class TradingCoordinator:
                 async for message in websocket:
                     # Handle client messages (e.g., subscribe to specific updates)
                     try:
-                        data = json.loads(message)
-                        self.logger.debug(f"WebSocket message received: {data}")
-                    except json.JSONDecodeError:
+                        data = orjson.loads(message)
+                        self.logger.debug("WebSocket message received: %s", data)
+                    except orjson.JSONDecodeError:
                         self.logger.warning(f"Invalid JSON from client: {message}")
                         
             except websockets.exceptions.ConnectionClosed:
                 self.logger.info(f"WebSocket client disconnected: {websocket.remote_address}")
             finally:
-                self.ws_clients.discard(websocket)
+                self.ws_clients.pop(websocket, None)
+                writer.cancel()
         
         try:
-            import json
-            server = await websockets.serve(handle_client, host, port)
-            self.logger.info(f"WebSocket server started on ws://{host}:{port}")
-            
-            await asyncio.Future()  # Run forever
+            async with websockets.serve(handle_client, host, port):
+                self.logger.info(f"WebSocket server started on ws://{host}:{port}")
+                # Leaving the context closes the server and every client connection
+                await self._stop_event.wait()
             
         except Exception as e:
             self.logger.error(f"WebSocket server error: {e}", exc_info=True)
     
+    @staticmethod
+    async def _ws_writer(websocket, send_queue: asyncio.Queue):
+        """Drain one client's queue so a slow client only ever delays itself"""
+        while True:
+            message = await send_queue.get()
+            try:
+                await websocket.send(message)
+            except Exception:
+                return  # the client's receive loop sees the close and cleans up
+    
     async def _broadcast_update(self, update: Dict):
         """Broadcast update to all connected WebSocket clients"""
         if not self.ws_clients:
             return
         
         try:
-            import json
-            message = json.dumps(update)
+            # Serialize once for every client; decode so frames stay text
+            message = orjson.dumps(update, option=orjson.OPT_SERIALIZE_NUMPY).decode()
             
-            # Send to all clients (remove disconnected ones)
-            disconnected = set()
-            for client in self.ws_clients:
-                try:
-                    await client.send(message)
-                except Exception:
-                    disconnected.add(client)
-            
-            # Clean up disconnected clients
-            self.ws_clients -= disconnected
+            # Enqueue without awaiting; a client that fell a full queue behind loses
+            # its oldest update, since each update supersedes the previous one
+            for send_queue in self.ws_clients.values():
+                if send_queue.full():
+                    send_queue.get_nowait()
+                send_queue.put_nowait(message)
             
         except Exception as e:
-            self.logger.debug(f"Error broadcasting update: {e}")
+            self.logger.debug("Error broadcasting update: %s", e)
     
-    async def _broadcast_status_update(self, snapshot=None, decision=None, risk_check=None):
+    async def _broadcast_status_update(self, snapshot=None, decision=None, risk_check=None, model_health=None):
         """Broadcast comprehensive status update including models, coordinator, and system status"""
+        if not self.ws_clients:
+            return  # nobody listening; skip the model health round-trips
+        
         try:
-            # Get model health status
-            model_health = await self.ensemble.check_model_health()
+            # Get model health status, unless the caller just checked it
+            if model_health is None:
+                model_health = await self.ensemble.check_model_health()
             
-            # Build comprehensive status
-            status = {
-                'type': 'status_update',
-                'timestamp': datetime.utcnow().isoformat(),
-                
-                # Coordinator status
-                'coordinator': {
-                    'status': 'running' if self.is_running else 'stopped',
-                    'dry_run': self.config.get('dry_run', True),
-                    'testnet': self.config.get('testnet', True),
-                    'symbol': self.config.get('trading', {}).get('symbol', 'BTCUSDT'),
-                    'uptime_seconds': int(time.time() - self.start_time) if hasattr(self, 'start_time') else 0,
-                    'websocket_clients': len(self.ws_clients),
-                    'open_trades': len(self.open_trades),
-                    'circuit_breaker': 'active' if self.risk_manager.circuit_breaker_active() else 'normal',
-                    'cpu_usage': round(psutil.Process().cpu_percent(interval=0.1), 1),
-                    'memory_usage': round(psutil.Process().memory_info().rss / 1024 / 1024, 1)
-                },
-                
-                # Model server status
-                'models': self._format_model_health(model_health),
-                
-                # Market snapshot (if available)
-                'market': {
-                    'price': snapshot.get('current_price') if snapshot else None,
-                    'rsi': snapshot.get('indicators', {}).get('rsi') if snapshot else None,
-                    'volume_24h': snapshot.get('volume_24h') if snapshot else None,
-                } if snapshot else {},
-                
-                # Latest decision (if available)
-                'decision': {
-                    'action': decision.get('action') if decision else 'hold',
-                    'confidence': decision.get('confidence') if decision else 0,
-                    'risk_approved': risk_check.get('approved') if risk_check else None,
-                } if decision else {},
-                
-                # Performance metrics
-                'performance': {
-                    'total_pnl': 0,  # TODO: Get from data logger
-                    'daily_pnl': 0,
-                    'win_rate': 0,
-                    'total_trades': 0,
-                }
-            }
+            # Refresh the preallocated payload in place; no await from here until it
+            # has been serialized, so concurrent broadcasts can't interleave
+            status = self._status_buf
+            # orjson formats the datetime itself, to the same string isoformat() gives
+            status['timestamp'] = datetime.now(timezone.utc)
+            
+            # Coordinator status
+            coordinator = status['coordinator']
+            coordinator['status'] = 'running' if self.is_running else 'stopped'
+            coordinator['uptime_seconds'] = int(time.monotonic() - self.start_time) if hasattr(self, 'start_time') else 0
+            coordinator['websocket_clients'] = len(self.ws_clients)
+            coordinator['open_trades'] = len(self.open_trades)
+            coordinator['circuit_breaker'] = 'active' if self.risk_manager.circuit_breaker_active() else 'normal'
+            # Non-blocking: CPU share since the previous status update
+            coordinator['cpu_usage'] = round(self._process.cpu_percent(interval=None), 1)
+            coordinator['memory_usage'] = round(self._process.memory_info().rss / 1024 / 1024, 1)
+            
+            # Model server status
+            status['models'] = self._format_model_health(model_health)
+            
+            # Market snapshot (if available)
+            if snapshot:
+                market = status['market'] = self._status_market
+                market['price'] = snapshot.get('current_price')
+                market['rsi'] = snapshot.get('indicators', {}).get('rsi')
+                market['volume_24h'] = snapshot.get('volume_24h')
+            else:
+                status['market'] = _EMPTY_SECTION
+            
+            # Latest decision (if available)
+            if decision:
+                latest = status['decision'] = self._status_decision
+                latest['action'] = decision.get('action')
+                latest['confidence'] = decision.get('confidence')
+                latest['risk_approved'] = risk_check.get('approved') if risk_check else None
+            else:
+                status['decision'] = _EMPTY_SECTION
             
             await self._broadcast_update(status)
             
         except Exception as e:
-            self.logger.debug(f"Error broadcasting status update: {e}")
+            self.logger.debug("Error broadcasting status update: %s", e)
     
     def _format_model_health(self, health_status):
         """Format model health status for dashboard"""
@@ -828,7 +1202,7 @@ class TradingCoordinator:
     async def shutdown(self):
         """Graceful shutdown with cleanup"""
         self.logger.info("Shutting down Trading Coordinator")
-        self.is_running = False
+        self.request_stop()
         
         # Log shutdown event
         await self.data_logger.log_system_event(
@@ -842,33 +1216,31 @@ class TradingCoordinator:
         if self.open_trades:
             self.logger.warning(f"Shutting down with {len(self.open_trades)} open positions")
             
-            if self.config.get('safety', {}).get('close_positions_on_shutdown', False):
+            if self.cfg.safety.close_positions_on_shutdown:
                 self.logger.info("Closing all open positions")
                 for trade_id, trade_info in list(self.open_trades.items()):
                     try:
                         # Cancel any open orders
-                        order_state = trade_info.get('order_state')
+                        order_state = trade_info.order_state
                         if order_state:
                             await self.binance_client.cancel_order(order_state.order_id)
                             self.logger.info(f"Cancelled order {order_state.order_id}")
                     except Exception as e:
                         self.logger.error(f"Failed to cancel order: {e}")
         
-        # Close WebSocket connections
-        if self.ws_clients:
-            self.logger.info(f"Closing {len(self.ws_clients)} WebSocket connections")
-            for client in list(self.ws_clients):
-                try:
-                    await client.close()
-                except Exception:
-                    pass
-            self.ws_clients.clear()
-        
         # Close components
         try:
+            # The API thread reads the data logger, so it goes first
+            if self.api_server:
+                await self.api_server.stop_thread()
+            if self._metrics_runner:
+                await self._metrics_runner.cleanup()
             await self.market_data.close()
             await self.data_logger.close()
             await self.binance_client.close()
+            await self.ensemble.close()
+            if self.http:
+                await self.http.close()
             
             # Close telegram alerter
             if TELEGRAM_AVAILABLE:
@@ -883,6 +1255,9 @@ class TradingCoordinator:
             self.logger.error(f"Error closing components: {e}")
         
         self.logger.info("Trading Coordinator shutdown complete")
+        
+        # Flush queued records to the handlers before the process exits
+        self._stop_log_listener()
     
     def get_status(self) -> Dict:
         """Get current coordinator status for API/dashboard"""
@@ -892,21 +1267,14 @@ class TradingCoordinator:
             'circuit_breaker_active': self.risk_manager.circuit_breaker_active() if self.risk_manager else False,
             'websocket_clients': len(self.ws_clients),
             'config': {
-                'dry_run': self.config.get('dry_run', True),
-                'testnet': self.config.get('testnet', True),
-                'symbol': self.config.get('trading', {}).get('symbol', 'BTCUSDT'),
-                'heartbeat_interval': self.config.get('timing', {}).get('heartbeat_interval', 60)
+                'dry_run': self.cfg.dry_run,
+                'testnet': self.cfg.testnet,
+                'symbol': self.cfg.trading.symbol,
+                'heartbeat_interval': self.cfg.timing.heartbeat_interval
             }
         }
 
 
-def signal_handler(coordinator):
-    def handler(signum, frame):
-        logging.info(f"Received signal {signum}, shutting down...")
-        coordinator.is_running = False
-    return handler
-
-
 async def main():
     config_path = os.getenv('CONFIG_PATH', 'config.yaml')
     
@@ -915,11 +1283,22 @@ async def main():
     
     coordinator = TradingCoordinator(config_path)
     
-    signal.signal(signal.SIGINT, signal_handler(coordinator))
-    signal.signal(signal.SIGTERM, signal_handler(coordinator))
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, coordinator.request_stop)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler
+            signal.signal(signum, lambda *_: loop.call_soon_threadsafe(coordinator.request_stop))
     
     await coordinator.start()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
@@ -1,10 +1,21 @@
+import asyncio
 import logging
 import os
 import csv
-import json
-from typing import Dict, List, Optional
+import time
+from itertools import groupby
+from typing import AsyncIterator, Dict, List, Optional
 from datetime import datetime, timedelta
 import aiosqlite
+import orjson
+
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+def _dumps(obj) -> str:
+    """orjson-encode to str so JSON columns stay TEXT"""
+    return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
 
 
 class DataLogger:
@@ -19,6 +30,31 @@ class DataLogger:
     - Feature snapshots at decision time
     """
     
+    _INSERT_PREDICTION_SQL = """
+        INSERT INTO model_predictions (
+            timestamp, snapshot_id, model_name, action, confidence,
+            probability, expected_return, latency_ms, raw_response
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    _INSERT_ORDER_SQL = """
+        INSERT OR REPLACE INTO orders (
+            order_id, trade_id, timestamp, symbol, side, type,
+            quantity, price, status, order_type_label, created_at, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    _INSERT_EVENT_SQL = """
+        INSERT INTO system_events (
+            timestamp, event_type, severity, component, message, details
+        )
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    
+    _WRITE_BATCH_SIZE = 64
+    
     def __init__(self, config: Dict):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -31,6 +67,9 @@ class DataLogger:
         os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
         
         self.db = None
+        # Write-behind queue of (sql, params) for rows nobody needs an id back from
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
     
     async def initialize(self):
         """Initialize database with schema v2"""
@@ -184,6 +223,8 @@ class DataLogger:
         
         await self.db.commit()
         
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        
         self.logger.info(f"Database schema v2 initialized at {self.sqlite_path}")
         
         # Initialize CSV file if it doesn't exist
@@ -208,7 +249,7 @@ class DataLogger:
             snapshot_id for foreign key references
         """
         try:
-            timestamp = datetime.utcnow().timestamp()
+            timestamp = time.time()
             
             indicators = snapshot.get('indicators', {})
             spread = snapshot.get('ask', 0) - snapshot.get('bid', 0)
@@ -228,8 +269,8 @@ class DataLogger:
                 spread,
                 snapshot.get('volume_24h', 0),
                 snapshot.get('price_change_24h', 0),
-                json.dumps(indicators),
-                json.dumps(snapshot)
+                _dumps(indicators),
+                _dumps(snapshot)
             ))
             
             await self.db.commit()
@@ -252,19 +293,11 @@ class DataLogger:
         expected_return: Optional[float] = None,
         latency_ms: Optional[float] = None,
         raw_response: Optional[Dict] = None
-    ) -> int:
-        """Log individual model prediction"""
+    ):
+        """Queue an individual model prediction for the background writer"""
         try:
-            timestamp = datetime.utcnow().timestamp()
-            
-            cursor = await self.db.execute("""
-                INSERT INTO model_predictions (
-                    timestamp, snapshot_id, model_name, action, confidence,
-                    probability, expected_return, latency_ms, raw_response
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                timestamp,
+            self._write_queue.put_nowait((self._INSERT_PREDICTION_SQL, (
+                time.time(),
                 snapshot_id,
                 model_name,
                 action,
@@ -272,18 +305,35 @@ class DataLogger:
                 probability,
                 expected_return,
                 latency_ms,
-                json.dumps(raw_response) if raw_response else None
-            ))
+                _dumps(raw_response) if raw_response else None
+            )))
             
-            await self.db.commit()
-            prediction_id = cursor.lastrowid
-            
-            self.logger.debug(f"Prediction logged: {model_name} -> {action}")
-            return prediction_id
+            self.logger.debug(f"Prediction queued: {model_name} -> {action}")
             
         except Exception as e:
             self.logger.error(f"Error logging prediction: {e}", exc_info=True)
-            return -1
+    
+    async def log_model_predictions(self, snapshot_id: int, responses: List[Dict]):
+        """Queue every model response of one cycle; written by the same batched writer"""
+        try:
+            timestamp = time.time()
+            for response in responses:
+                self._write_queue.put_nowait((self._INSERT_PREDICTION_SQL, (
+                    timestamp,
+                    snapshot_id,
+                    response.get('model_name', 'unknown'),
+                    response.get('action', 'hold'),
+                    response.get('confidence', 0),
+                    response.get('probability'),
+                    response.get('expected_return'),
+                    response.get('latency_ms'),
+                    _dumps(response)
+                )))
+            
+            self.logger.debug(f"{len(responses)} predictions queued for snapshot {snapshot_id}")
+            
+        except Exception as e:
+            self.logger.error(f"Error logging predictions: {e}", exc_info=True)
     
     async def log_ensemble_decision(
         self,
@@ -302,7 +352,7 @@ class DataLogger:
     ) -> int:
         """Log ensemble decision"""
         try:
-            timestamp = datetime.utcnow().timestamp()
+            timestamp = time.time()
             
             cursor = await self.db.execute("""
                 INSERT INTO ensemble_decisions (
@@ -351,7 +401,7 @@ class DataLogger:
     ) -> int:
         """Log trade opening"""
         try:
-            timestamp = datetime.utcnow().timestamp()
+            timestamp = time.time()
             
             cursor = await self.db.execute("""
                 INSERT INTO trades (
@@ -396,7 +446,7 @@ class DataLogger:
     ):
         """Log trade closing"""
         try:
-            timestamp = datetime.utcnow().timestamp()
+            timestamp = time.time()
             
             # Get entry time to calculate hold duration
             cursor = await self.db.execute(
@@ -468,36 +518,24 @@ class DataLogger:
         status: str,
         order_type_label: str = 'ENTRY'
     ):
-        """Log individual order"""
-        try:
-            timestamp = datetime.utcnow().timestamp()
-            
-            await self.db.execute("""
-                INSERT OR REPLACE INTO orders (
-                    order_id, trade_id, timestamp, symbol, side, type,
-                    quantity, price, status, order_type_label, created_at, updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                order_id,
-                trade_id,
-                timestamp,
-                symbol,
-                side,
-                order_type,
-                quantity,
-                price,
-                status,
-                order_type_label,
-                timestamp,
-                timestamp
-            ))
-            
-            await self.db.commit()
-            self.logger.debug(f"Order logged: {order_id} ({order_type_label})")
-            
-        except Exception as e:
-            self.logger.error(f"Error logging order: {e}", exc_info=True)
+        """Queue an individual order for the background writer"""
+        timestamp = time.time()
+        
+        self._write_queue.put_nowait((self._INSERT_ORDER_SQL, (
+            order_id,
+            trade_id,
+            timestamp,
+            symbol,
+            side,
+            order_type,
+            quantity,
+            price,
+            status,
+            order_type_label,
+            timestamp,
+            timestamp
+        )))
+        self.logger.debug(f"Order queued: {order_id} ({order_type_label})")
     
     async def log_system_event(
         self,
@@ -507,76 +545,102 @@ class DataLogger:
         message: Optional[str] = None,
         details: Optional[Dict] = None
     ):
-        """Log system event"""
+        """Queue a system event for the background writer"""
         try:
-            timestamp = datetime.utcnow().timestamp()
-            
-            await self.db.execute("""
-                INSERT INTO system_events (
-                    timestamp, event_type, severity, component, message, details
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                timestamp,
+            self._write_queue.put_nowait((self._INSERT_EVENT_SQL, (
+                time.time(),
                 event_type,
                 severity,
                 component,
                 message,
-                json.dumps(details) if details else None
-            ))
+                _dumps(details) if details else None
+            )))
             
-            await self.db.commit()
-            self.logger.debug(f"System event logged: {event_type} ({severity})")
+            self.logger.debug(f"System event queued: {event_type} ({severity})")
             
         except Exception as e:
             self.logger.error(f"Error logging system event: {e}", exc_info=True)
     
+    async def _writer_loop(self):
+        """Drain queued rows and commit each batch in one transaction"""
+        while True:
+            rows = [await self._write_queue.get()]
+            while len(rows) < self._WRITE_BATCH_SIZE and not self._write_queue.empty():
+                rows.append(self._write_queue.get_nowait())
+            
+            try:
+                for sql, group in groupby(rows, key=lambda row: row[0]):
+                    await self.db.executemany(sql, [params for _, params in group])
+                await self.db.commit()
+            except Exception as e:
+                self.logger.error(f"Failed to write {len(rows)} queued rows: {e}")
+            finally:
+                for _ in rows:
+                    self._write_queue.task_done()
+    
+    async def flush(self):
+        """Wait until every queued row has been committed"""
+        # Without a running writer nothing drains the queue; join() would never return
+        if self._writer_task and not self._writer_task.done():
+            await self._write_queue.join()
+    
     # ============================================================
     # QUERY METHODS - ANALYTICS & REPORTING
     # ============================================================
     
+    _RECENT_TRADES_SQL = """
+        SELECT trade_id, timestamp, symbol, side, entry_price, exit_price,
+               quantity, pnl, pnl_percent, status, entry_time, exit_time,
+               hold_duration, decision_confidence
+        FROM trades
+        ORDER BY timestamp DESC
+        LIMIT ?
+    """
+    
+    @staticmethod
+    def _trade_row_to_dict(row) -> Dict:
+        return {
+            'trade_id': row[0],
+            'timestamp': datetime.utcfromtimestamp(row[1]).isoformat() if row[1] else None,
+            'symbol': row[2],
+            'side': row[3],
+            'entry_price': row[4],
+            'exit_price': row[5],
+            'quantity': row[6],
+            'pnl': row[7],
+            'pnl_percent': row[8],
+            'status': row[9],
+            'entry_time': datetime.utcfromtimestamp(row[10]).isoformat() if row[10] else None,
+            'exit_time': datetime.utcfromtimestamp(row[11]).isoformat() if row[11] else None,
+            'hold_duration': row[12],
+            'confidence': row[13]
+        }
+    
     async def get_recent_trades(self, limit: int = 100) -> List[Dict]:
         """Get recent trades with all details"""
         try:
-            cursor = await self.db.execute("""
-                SELECT trade_id, timestamp, symbol, side, entry_price, exit_price,
-                       quantity, pnl, pnl_percent, status, entry_time, exit_time,
-                       hold_duration, decision_confidence
-                FROM trades
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (limit,))
+            cursor = await self.db.execute(self._RECENT_TRADES_SQL, (limit,))
             
             rows = await cursor.fetchall()
             
-            trades = []
-            for row in rows:
-                trades.append({
-                    'trade_id': row[0],
-                    'timestamp': datetime.utcfromtimestamp(row[1]).isoformat() if row[1] else None,
-                    'symbol': row[2],
-                    'side': row[3],
-                    'entry_price': row[4],
-                    'exit_price': row[5],
-                    'quantity': row[6],
-                    'pnl': row[7],
-                    'pnl_percent': row[8],
-                    'status': row[9],
-                    'entry_time': datetime.utcfromtimestamp(row[10]).isoformat() if row[10] else None,
-                    'exit_time': datetime.utcfromtimestamp(row[11]).isoformat() if row[11] else None,
-                    'hold_duration': row[12],
-                    'confidence': row[13]
-                })
-            
-            return trades
+            return [self._trade_row_to_dict(row) for row in rows]
             
         except Exception as e:
             self.logger.error(f"Error getting recent trades: {e}", exc_info=True)
             return []
     
+    async def stream_recent_trades(self, limit: int = 100) -> AsyncIterator[Dict]:
+        """Yield recent trades one row at a time from a cursor instead of materializing the list"""
+        async with self.db.execute(self._RECENT_TRADES_SQL, (limit,)) as cursor:
+            async for row in cursor:
+                yield self._trade_row_to_dict(row)
+    
     async def get_model_performance_stats(self, model_name: Optional[str] = None, days: int = 7) -> Dict:
         """Get model prediction accuracy stats"""
         try:
+            # Predictions are written behind; include the ones still queued
+            await self.flush()
+            
             cutoff_timestamp = (datetime.utcnow() - timedelta(days=days)).timestamp()
             
             if model_name:
@@ -672,6 +736,10 @@ class DataLogger:
             return {}
     
     async def close(self):
+        if self._writer_task:
+            await self.flush()
+            self._writer_task.cancel()
+            self._writer_task = None
         if self.db:
             await self.db.close()
             self.logger.info("Database connection closed")
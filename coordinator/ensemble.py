@@ -2,52 +2,121 @@ import asyncio
 import logging
 from typing import Dict, List, Optional
 import aiohttp
+import orjson
 from datetime import datetime
 
 
 class EnsembleAggregator:
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, session: Optional[aiohttp.ClientSession] = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.model_endpoints = config.get('model_endpoints', [])
         self.ensemble_config = config.get('ensemble', {})
         self.timeout = config.get('timing', {}).get('model_timeout', 5)
         
-        self.model_performance = {}
+        # Settings read on every cycle, bound once
+        self.symbol = config.get('trading', {}).get('symbol', 'BTCUSDT')
+        self.method = self.ensemble_config.get('method', 'weighted_vote')
+        self.weight_decay = self.ensemble_config.get('weight_decay', 0.95)
+        self.min_responding = self.ensemble_config.get('min_responding_models', 1)
+        # Optional cycle-wide deadline; models that miss it are dropped from this vote
+        deadline_ms = self.ensemble_config.get('prediction_deadline_ms')
+        self.prediction_deadline = deadline_ms / 1000 if deadline_ms else None
+        
+        # Shared keep-alive session; created lazily (and owned) if none is injected
+        self.session = session
+        self._owns_session = False
+        
+        # Per-model performance stored as parallel dicts keyed by "host:port"
+        self.weights: Dict[str, float] = {}
+        self.success_counts: Dict[str, int] = {}
+        self.failure_counts: Dict[str, int] = {}
+        self.avg_response_times: Dict[str, float] = {}
+        self.last_success: Dict[str, Optional[datetime]] = {}
+        self.last_predictions: Dict[str, Dict] = {}
+        self.enabled: Dict[str, bool] = {}
+        # Enabled endpoints, fixed at startup; the per-cycle fan-outs iterate this
+        self.active_endpoints: List[Dict] = []
+        
         for endpoint in self.model_endpoints:
             key = f"{endpoint['host']}:{endpoint['port']}"
-            self.model_performance[key] = {
-                "weight": endpoint.get('weight', 1.0),
-                "success_count": 0,
-                "failure_count": 0,
-                "avg_response_time": 0.0,
-                "last_success": None,
-                "enabled": endpoint.get('enabled', True)
-            }
+            self.weights[key] = endpoint.get('weight', 1.0)
+            self.success_counts[key] = 0
+            self.failure_counts[key] = 0
+            self.avg_response_times[key] = 0.0
+            self.last_success[key] = None
+            self.enabled[key] = endpoint.get('enabled', True)
+            if self.enabled[key]:
+                self.active_endpoints.append(endpoint)
+    
+    def get_performance(self, key: str) -> Optional[Dict]:
+        """Assemble the performance record of a single model"""
+        if key not in self.success_counts:
+            return None
+        
+        perf = {
+            "weight": self.weights[key],
+            "success_count": self.success_counts[key],
+            "failure_count": self.failure_counts[key],
+            "avg_response_time": self.avg_response_times[key],
+            "last_success": self.last_success[key],
+            "enabled": self.enabled[key]
+        }
+        if key in self.last_predictions:
+            perf['last_prediction'] = self.last_predictions[key]
+        return perf
+    
+    @property
+    def model_performance(self) -> Dict[str, Dict]:
+        """Per-model performance records (built on access from the per-field dicts)"""
+        return {key: self.get_performance(key) for key in self.success_counts}
+    
+    def set_session(self, session: aiohttp.ClientSession):
+        """Use an externally managed session for all model server requests"""
+        self.session = session
+        self._owns_session = False
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=75),
+                headers={'Connection': 'keep-alive'}
+            )
+            self._owns_session = True
+        return self.session
+    
+    async def close(self):
+        if self._owns_session and self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._owns_session = False
     
     async def get_model_predictions(self, snapshot: Dict) -> List[Dict]:
         tasks = []
-        active_endpoints = [ep for ep in self.model_endpoints if ep.get('enabled', True)]
         
-        if not active_endpoints:
+        if not self.active_endpoints:
             self.logger.warning("No active model endpoints configured")
             return []
         
-        for endpoint in active_endpoints:
-            tasks.append(self._query_model(endpoint, snapshot))
+        for endpoint in self.active_endpoints:
+            tasks.append(asyncio.ensure_future(self._query_model(endpoint, snapshot)))
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Hedge against slow models: vote with whatever answered before the deadline
+        done, pending = await asyncio.wait(tasks, timeout=self.prediction_deadline)
+        for task in pending:
+            task.cancel()
         
         predictions = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.logger.error(f"Model {active_endpoints[i]['name']} error: {result}")
-            elif result is not None:
-                predictions.append(result)
+        for endpoint, task in zip(self.active_endpoints, tasks):
+            if task in pending:
+                self.logger.warning(f"Model {endpoint['name']} missed the {self.prediction_deadline}s deadline")
+            elif task.exception() is not None:
+                self.logger.error(f"Model {endpoint['name']} error: {task.exception()}")
+            elif task.result() is not None:
+                predictions.append(task.result())
         
-        min_responding = self.ensemble_config.get('min_responding_models', 1)
-        if len(predictions) < min_responding:
-            self.logger.warning(f"Only {len(predictions)} models responded, minimum is {min_responding}")
+        if len(predictions) < self.min_responding:
+            self.logger.warning(f"Only {len(predictions)} models responded, minimum is {self.min_responding}")
         
         return predictions
     
@@ -56,7 +125,7 @@ class EnsembleAggregator:
         key = f"{endpoint['host']}:{endpoint['port']}"
         
         payload = {
-            "symbol": self.config['trading']['symbol'],
+            "symbol": self.symbol,
             "timeframe": "5m",
             "candles": snapshot.get('candles_5m', []),
             "indicators": snapshot.get('indicators', {}),
@@ -70,23 +139,22 @@ class EnsembleAggregator:
         
         try:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=payload) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        response_time = asyncio.get_event_loop().time() - start_time
-                        self._update_performance(key, success=True, response_time=response_time, prediction_data=result)
-                        
-                        result['model_name'] = endpoint['name']
-                        result['model_key'] = key
-                        result['response_time'] = response_time
-                        
-                        return result
-                    else:
-                        self.logger.error(f"Model {endpoint['name']} returned status {response.status}")
-                        self._update_performance(key, success=False)
-                        return None
+            async with self._get_session().post(url, json=payload, timeout=timeout) as response:
+                if response.status == 200:
+                    result = orjson.loads(await response.read())
+                    
+                    response_time = asyncio.get_event_loop().time() - start_time
+                    self._update_performance(key, success=True, response_time=response_time, prediction_data=result)
+                    
+                    result['model_name'] = endpoint['name']
+                    result['model_key'] = key
+                    result['response_time'] = response_time
+                    
+                    return result
+                else:
+                    self.logger.error(f"Model {endpoint['name']} returned status {response.status}")
+                    self._update_performance(key, success=False)
+                    return None
         
         except asyncio.TimeoutError:
             self.logger.error(f"Model {endpoint['name']} timeout after {self.timeout}s")
@@ -98,29 +166,28 @@ class EnsembleAggregator:
             return None
     
     def _update_performance(self, key: str, success: bool, response_time: float = 0.0, prediction_data: Dict = None):
-        if key not in self.model_performance:
+        if key not in self.success_counts:
             return
         
-        perf = self.model_performance[key]
-        
         if success:
-            perf['success_count'] += 1
-            perf['last_success'] = datetime.utcnow()
+            self.success_counts[key] += 1
+            self.last_success[key] = datetime.utcnow()
             
-            if perf['avg_response_time'] == 0:
-                perf['avg_response_time'] = response_time
+            avg_response_time = self.avg_response_times[key]
+            if avg_response_time == 0:
+                self.avg_response_times[key] = response_time
             else:
-                perf['avg_response_time'] = 0.8 * perf['avg_response_time'] + 0.2 * response_time
+                self.avg_response_times[key] = 0.8 * avg_response_time + 0.2 * response_time
             
             # Store latest prediction data for dashboard
             if prediction_data:
-                perf['last_prediction'] = {
+                self.last_predictions[key] = {
                     'action': prediction_data.get('action'),
                     'confidence': prediction_data.get('confidence', 0),
                     'timestamp': datetime.utcnow().isoformat()
                 }
         else:
-            perf['failure_count'] += 1
+            self.failure_counts[key] += 1
     
     def aggregate(self, predictions: List[Dict]) -> Dict:
         if not predictions:
@@ -133,7 +200,7 @@ class EnsembleAggregator:
                 "participating_models": []
             }
         
-        method = self.ensemble_config.get('method', 'weighted_vote')
+        method = self.method
         
         if method == 'weighted_vote':
             return self._weighted_vote(predictions)
@@ -153,14 +220,14 @@ class EnsembleAggregator:
         take_profits = []
         participating_models = []
         
-        weight_decay = self.ensemble_config.get('weight_decay', 0.95)
+        weight_decay = self.weight_decay
         
         for pred in predictions:
             model_key = pred.get('model_key')
-            base_weight = self.model_performance.get(model_key, {}).get('weight', 1.0)
+            base_weight = self.weights.get(model_key, 1.0)
             
-            perf = self.model_performance.get(model_key, {})
-            success_rate = perf['success_count'] / max(perf['success_count'] + perf['failure_count'], 1)
+            success_count = self.success_counts.get(model_key, 0)
+            success_rate = success_count / max(success_count + self.failure_counts.get(model_key, 0), 1)
             performance_weight = base_weight * (success_rate ** weight_decay)
             
             action = pred.get('action', 'hold').lower()
@@ -283,44 +350,41 @@ class EnsembleAggregator:
     
     async def send_retrain_feedback(self, feedback_data: Dict):
         tasks = []
-        active_endpoints = [ep for ep in self.model_endpoints if ep.get('enabled', True)]
         
-        for endpoint in active_endpoints:
+        for endpoint in self.active_endpoints:
             tasks.append(self._send_feedback_to_model(endpoint, feedback_data))
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         success_count = sum(1 for r in results if r is True)
-        self.logger.info(f"Sent feedback to {success_count}/{len(active_endpoints)} models")
+        self.logger.info(f"Sent feedback to {success_count}/{len(self.active_endpoints)} models")
     
     async def _send_feedback_to_model(self, endpoint: Dict, feedback_data: Dict) -> bool:
         url = f"http://{endpoint['host']}:{endpoint['port']}/retrain"
         
         try:
             timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=feedback_data) as response:
-                    if response.status == 200:
-                        self.logger.debug(f"Feedback sent to {endpoint['name']}")
-                        return True
-                    else:
-                        self.logger.warning(f"Feedback to {endpoint['name']} failed: {response.status}")
-                        return False
+            async with self._get_session().post(url, json=feedback_data, timeout=timeout) as response:
+                if response.status == 200:
+                    self.logger.debug(f"Feedback sent to {endpoint['name']}")
+                    return True
+                else:
+                    self.logger.warning(f"Feedback to {endpoint['name']} failed: {response.status}")
+                    return False
         except Exception as e:
             self.logger.error(f"Error sending feedback to {endpoint['name']}: {e}")
             return False
     
     async def check_model_health(self):
         tasks = []
-        active_endpoints = [ep for ep in self.model_endpoints if ep.get('enabled', True)]
         
-        for endpoint in active_endpoints:
+        for endpoint in self.active_endpoints:
             tasks.append(self._check_model_health(endpoint))
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         healthy_count = sum(1 for r in results if isinstance(r, dict) and r.get('healthy'))
-        self.logger.info(f"Health check: {healthy_count}/{len(active_endpoints)} models healthy")
+        self.logger.info(f"Health check: {healthy_count}/{len(self.active_endpoints)} models healthy")
         
         return results
     
@@ -330,22 +394,21 @@ class EnsembleAggregator:
         
         try:
             timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        health_data = await response.json()
-                        return {
-                            "model_name": endpoint['name'],
-                            "healthy": True,
-                            "data": health_data,
-                            "performance": self.model_performance.get(key)
-                        }
-                    else:
-                        return {
-                            "model_name": endpoint['name'],
-                            "healthy": False,
-                            "error": f"Status {response.status}"
-                        }
+            async with self._get_session().get(url, timeout=timeout) as response:
+                if response.status == 200:
+                    health_data = orjson.loads(await response.read())
+                    return {
+                        "model_name": endpoint['name'],
+                        "healthy": True,
+                        "data": health_data,
+                        "performance": self.get_performance(key)
+                    }
+                else:
+                    return {
+                        "model_name": endpoint['name'],
+                        "healthy": False,
+                        "error": f"Status {response.status}"
+                    }
         except Exception as e:
             return {
                 "model_name": endpoint['name'],
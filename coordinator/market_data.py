@@ -17,6 +17,10 @@ class MarketDataCollector:
         self.symbol = config['trading']['symbol']
         self.testnet = config.get('testnet', True)
         
+        data_config = config.get('data', {})
+        self.timeframes = data_config.get('timeframes', ['5m', '1h'])
+        self.candles_count = data_config.get('candles_count', 100)
+        
         # Use Binance API directly (no ccxt dependency issues)
         if self.testnet:
             self.base_url = "https://testnet.binancefuture.com"
@@ -43,8 +47,8 @@ class MarketDataCollector:
     async def get_snapshot(self) -> Dict:
         """Get complete market snapshot with candles, price, and indicators"""
         try:
-            timeframes = self.config['data'].get('timeframes', ['5m', '1h'])
-            candles_count = self.config['data'].get('candles_count', 100)
+            timeframes = self.timeframes
+            candles_count = self.candles_count
             
             snapshot = {
                 'timestamp': datetime.utcnow().isoformat(),
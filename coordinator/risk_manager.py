@@ -43,7 +43,7 @@ class Trade:
     closed: bool = False
     
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskMetrics:
     """Current risk metrics"""
     total_equity: float
@@ -135,7 +135,11 @@ class RiskManager:
         self.circuit_breaker_open_time: Optional[float] = None
         self.last_trade_time: Optional[float] = None
         self.daily_reset_time = time.time()
+        # Monotonic deadline of the next UTC-midnight reset; immune to wall-clock steps
+        self._next_daily_reset = time.monotonic() + self._seconds_until_utc_midnight()
         self.daily_pnl = 0.0
+        # Non-negative mirror of daily_pnl, kept so limit checks need no sign handling
+        self.daily_loss = 0.0
         self.daily_trade_count = 0
         self.emergency_shutdown = False
         self.initial_equity: Optional[float] = None
@@ -278,15 +282,15 @@ class RiskManager:
         if self.daily_trade_count >= self.max_daily_trades:
             return False, f"Daily trade limit reached ({self.max_daily_trades})"
         
-        # Check daily loss limit (percent)
-        if self.initial_equity:
-            daily_loss_pct = abs(self.daily_pnl) / self.initial_equity
-            if self.daily_pnl < 0 and daily_loss_pct > self.max_daily_loss_percent:
+        # Check daily loss limits; only a losing day needs the percent/absolute math
+        daily_loss = self.daily_loss
+        if daily_loss > 0:
+            if self.initial_equity and daily_loss > self.max_daily_loss_percent * self.initial_equity:
+                daily_loss_pct = daily_loss / self.initial_equity
                 return False, f"Daily loss limit exceeded ({daily_loss_pct*100:.1f}% > {self.max_daily_loss_percent*100:.1f}%)"
-        
-        # Check daily loss limit (absolute)
-        if self.daily_pnl < -self.max_daily_loss_usd:
-            return False, f"Daily loss limit exceeded (${abs(self.daily_pnl):.2f} > ${self.max_daily_loss_usd:.2f})"
+            
+            if daily_loss > self.max_daily_loss_usd:
+                return False, f"Daily loss limit exceeded (${daily_loss:.2f} > ${self.max_daily_loss_usd:.2f})"
         
         # Check position count limit
         if risk_metrics.open_positions >= self.max_open_positions:
@@ -360,13 +364,12 @@ class RiskManager:
         Returns:
             PnL in USD
         """
-        # Calculate PnL
-        if trade.side.upper() == 'BUY':
-            pnl = (exit_price - trade.entry_price) * trade.quantity
-        else:  # SELL
-            pnl = (trade.entry_price - exit_price) * trade.quantity
-        
-        pnl_percent = pnl / (trade.entry_price * trade.quantity) if trade.entry_price * trade.quantity > 0 else 0
+        # Calculate PnL; quantity cancels out of the percent return
+        delta = exit_price - trade.entry_price
+        if trade.side.upper() != 'BUY':
+            delta = -delta
+        pnl = delta * trade.quantity
+        pnl_percent = delta / trade.entry_price if trade.entry_price > 0 and trade.quantity > 0 else 0
         
         # Update trade
         trade.exit_price = exit_price
@@ -376,6 +379,7 @@ class RiskManager:
         
         # Update metrics
         self.daily_pnl += pnl
+        self.daily_loss = -self.daily_pnl if self.daily_pnl < 0 else 0.0
         
         # Update consecutive losses and circuit breaker
         if pnl < 0:
@@ -392,7 +396,7 @@ class RiskManager:
         
         # Check emergency shutdown
         if self.initial_equity:
-            total_loss_pct = (self.initial_equity - (self.initial_equity + self.daily_pnl)) / self.initial_equity
+            total_loss_pct = self.daily_loss / self.initial_equity
             if total_loss_pct >= self.emergency_shutdown_loss_percent:
                 self._trigger_emergency_shutdown()
         
@@ -499,17 +503,24 @@ class RiskManager:
         self.emergency_shutdown = True
         logger.critical(f"EMERGENCY SHUTDOWN TRIGGERED: Loss exceeds {self.emergency_shutdown_loss_percent*100:.1f}%")
     
+    @staticmethod
+    def _seconds_until_utc_midnight() -> float:
+        return 86400 - time.time() % 86400
+    
     def _reset_daily_metrics_if_needed(self):
         """Reset daily metrics at start of new day"""
-        current_time = time.time()
-        time_since_reset = current_time - self.daily_reset_time
-        
-        # Reset at midnight or after 24 hours
-        if time_since_reset >= 86400:  # 24 hours
-            logger.info(f"Resetting daily metrics: trades={self.daily_trade_count}, pnl=${self.daily_pnl:.2f}")
-            self.daily_reset_time = current_time
-            self.daily_pnl = 0.0
-            self.daily_trade_count = 0
+        now = time.monotonic()
+        if now < self._next_daily_reset:
+            return
+        
+        # Reset at UTC midnight; step the deadline by whole days so it never drifts
+        logger.info(f"Resetting daily metrics: trades={self.daily_trade_count}, pnl=${self.daily_pnl:.2f}")
+        self.daily_reset_time = time.time()
+        self.daily_pnl = 0.0
+        self.daily_loss = 0.0
+        self.daily_trade_count = 0
+        while self._next_daily_reset <= now:
+            self._next_daily_reset += 86400
     
     def get_statistics(self) -> Dict:
         """Get comprehensive risk statistics"""
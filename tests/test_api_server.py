@@ -0,0 +1,238 @@
+import pytest
+import sys
+import os
+from datetime import datetime
+from types import SimpleNamespace
+
+import orjson
+from aiohttp.test_utils import make_mocked_request
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api_server import DashboardAPIServer
+
+
+@pytest.fixture
+def coordinator(tmp_path):
+    endpoints = [
+        {'host': '127.0.0.1', 'port': 8001, 'name': 'model1', 'enabled': True},
+        {'host': '127.0.0.1', 'port': 8002, 'name': 'model2', 'enabled': False}
+    ]
+    ensemble = SimpleNamespace(
+        model_endpoints=endpoints,
+        active_endpoints=endpoints[:1],
+        success_counts={'127.0.0.1:8001': 3},
+        failure_counts={'127.0.0.1:8001': 1},
+        avg_response_times={'127.0.0.1:8001': 0.05},
+        last_success={'127.0.0.1:8001': datetime(2025, 1, 1, 12, 0, 0)}
+    )
+    return SimpleNamespace(
+        ensemble=ensemble,
+        config={'logging': {'file': str(tmp_path / 'coordinator.log')}},
+        is_running=True,
+        current_position=None,
+        daily_stats={'trades': 0, 'pnl': 0.0, 'start_time': datetime(2025, 1, 1)}
+    )
+
+
+@pytest.fixture
+def server(coordinator):
+    return DashboardAPIServer(coordinator)
+
+
+@pytest.mark.asyncio
+async def test_get_models(server):
+    response = await server.get_models(make_mocked_request('GET', '/api/models'))
+
+    assert response.content_type == 'application/json'
+    models = orjson.loads(response.body)
+
+    assert len(models) == 1
+    assert models[0]['name'] == 'model1'
+    assert models[0]['success_rate'] == 0.75
+    assert models[0]['healthy'] is True
+    assert models[0]['last_success'] == '2025-01-01T12:00:00+00:00'
+
+
+@pytest.mark.asyncio
+async def test_get_status_serializes_datetimes(server):
+    response = await server.get_status(make_mocked_request('GET', '/api/status'))
+
+    status = orjson.loads(response.body)
+
+    assert status['is_running'] is True
+    assert status['daily_stats']['start_time'] == '2025-01-01T00:00:00+00:00'
+    assert 'timestamp' in status
+
+
+@pytest.mark.asyncio
+async def test_get_logs_returns_tail(server, coordinator):
+    log_file = coordinator.config['logging']['file']
+    with open(log_file, 'w') as f:
+        for i in range(500):
+            f.write(f"2025-01-01 00:00:{i % 60:02d},000 - coordinator - INFO - message {i} - detail\n")
+
+    response = await server.get_logs(make_mocked_request('GET', '/api/logs?limit=3'))
+    logs = orjson.loads(response.body)
+
+    assert [log['message'] for log in logs] == [
+        'message 497 - detail',
+        'message 498 - detail',
+        'message 499 - detail'
+    ]
+    assert logs[0]['level'] == 'INFO'
+
+
+@pytest.mark.asyncio
+async def test_tail_lines_small_chunks(tmp_path):
+    from api_server import _tail_lines
+
+    path = tmp_path / 'tail.log'
+    path.write_bytes(b''.join(f"line {i}\n".encode() for i in range(100)))
+
+    assert await _tail_lines(str(path), 5, chunk_size=7) == [f"line {i}".encode() for i in range(95, 100)]
+    assert len(await _tail_lines(str(path), 1000, chunk_size=7)) == 100
+
+
+@pytest.mark.asyncio
+async def test_status_cached_within_ttl(server, coordinator):
+    first = await server.get_status(make_mocked_request('GET', '/api/status'))
+
+    coordinator.is_running = False
+    cached = await server.get_status(make_mocked_request('GET', '/api/status'))
+    assert cached.body == first.body
+
+    server.invalidate_cache()
+    fresh = await server.get_status(make_mocked_request('GET', '/api/status'))
+    assert orjson.loads(fresh.body)['is_running'] is False
+
+
+@pytest.mark.asyncio
+async def test_threaded_server_queries_owner_loop(coordinator, unused_tcp_port):
+    import asyncio
+    import aiohttp
+    
+    calling_loops = []
+    
+    async def get_performance_stats():
+        calling_loops.append(asyncio.get_running_loop())
+        return {'total_trades': 3}
+    
+    coordinator.data_logger = SimpleNamespace(get_performance_stats=get_performance_stats)
+    server = DashboardAPIServer(coordinator, port=unused_tcp_port, host='127.0.0.1')
+    
+    await server.start_in_thread()
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f'http://127.0.0.1:{unused_tcp_port}/api/performance') as response:
+                assert await response.json() == {'total_trades': 3}
+            async with session.get(f'http://127.0.0.1:{unused_tcp_port}/api/status') as response:
+                assert (await response.json())['is_running'] is True
+    finally:
+        await server.stop_thread()
+    
+    # Served from the API thread, but the database call ran on the caller's loop
+    assert calling_loops == [asyncio.get_running_loop()]
+    assert server._thread is None
+
+
+def _trade_stream(rows, fail_after=None):
+    async def stream_recent_trades(limit):
+        for i, row in enumerate(rows[:limit]):
+            if i == fail_after:
+                raise RuntimeError('cursor failed')
+            yield row
+    return stream_recent_trades
+
+
+@pytest.mark.asyncio
+async def test_trades_query_failure_returns_error(server, coordinator):
+    from aiohttp.test_utils import TestClient, TestServer
+    
+    coordinator.data_logger = SimpleNamespace(stream_recent_trades=_trade_stream([{'trade_id': 0}], fail_after=0))
+    
+    async with TestClient(TestServer(server.app)) as client:
+        response = await client.get('/api/trades')
+        assert response.status == 500
+        assert 'error' in await response.json()
+
+
+@pytest.mark.asyncio
+async def test_trades_mid_stream_failure_aborts_response(server, coordinator):
+    import aiohttp
+    from aiohttp.test_utils import TestClient, TestServer
+    
+    rows = [{'trade_id': i} for i in range(3)]
+    coordinator.data_logger = SimpleNamespace(stream_recent_trades=_trade_stream(rows, fail_after=2))
+    
+    async with TestClient(TestServer(server.app)) as client:
+        response = await client.get('/api/trades')
+        assert response.status == 200
+        # No closing bracket: the client sees a broken transfer, not a short list
+        with pytest.raises(aiohttp.ClientPayloadError):
+            await response.read()
+
+
+@pytest.mark.asyncio
+async def test_threaded_server_streams_trades_in_chunks(coordinator, unused_tcp_port):
+    import asyncio
+    import aiohttp
+    
+    rows = [{'trade_id': i} for i in range(150)]
+    stream = _trade_stream(rows)
+    calling_loops = set()
+    
+    async def stream_recent_trades(limit):
+        async for row in stream(limit):
+            calling_loops.add(asyncio.get_running_loop())
+            yield row
+    
+    coordinator.data_logger = SimpleNamespace(stream_recent_trades=stream_recent_trades)
+    server = DashboardAPIServer(coordinator, port=unused_tcp_port, host='127.0.0.1')
+    
+    await server.start_in_thread()
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f'http://127.0.0.1:{unused_tcp_port}/api/trades?limit=140') as response:
+                assert await response.json() == rows[:140]
+    finally:
+        await server.stop_thread()
+    
+    assert calling_loops == {asyncio.get_running_loop()}
+
+
+@pytest.mark.asyncio
+async def test_threaded_server_start_failure_stops_thread(coordinator, unused_tcp_port):
+    import socket
+    
+    with socket.socket() as blocker:
+        blocker.bind(('127.0.0.1', unused_tcp_port))
+        blocker.listen()
+        
+        server = DashboardAPIServer(coordinator, port=unused_tcp_port, host='127.0.0.1')
+        with pytest.raises(OSError):
+            await server.start_in_thread()
+    
+    assert server._thread is None and server._loop is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache_from_owner_loop(coordinator, unused_tcp_port):
+    import aiohttp
+    
+    server = DashboardAPIServer(coordinator, port=unused_tcp_port, host='127.0.0.1', cache_ttl=60)
+    url = f'http://127.0.0.1:{unused_tcp_port}/api/status'
+    
+    await server.start_in_thread()
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                assert (await response.json())['is_running'] is True
+            
+            coordinator.is_running = False
+            server.invalidate_cache()
+            
+            async with session.get(url) as response:
+                assert (await response.json())['is_running'] is False
+    finally:
+        await server.stop_thread()
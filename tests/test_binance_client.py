@@ -0,0 +1,203 @@
+import asyncio
+import hashlib
+import hmac
+import aiohttp
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from binance_client import BinanceClient, OrderSide, OrderStatus, OrderType, RateLimiter
+
+
+@pytest.fixture
+def config():
+    return {
+        'testnet': True,
+        'dry_run': True,
+        'trading': {
+            'symbol': 'BTCUSDT',
+            'leverage': 1
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_dry_run_order_persisted(config, tmp_path):
+    client = BinanceClient(config)
+    client.order_db_path = str(tmp_path / 'orders.db')
+    await client.initialize()
+    
+    try:
+        order = await client.place_order(OrderSide.BUY, 0.0123)
+        loaded = await client._load_order_state(order.order_id)
+        
+        assert loaded.side == OrderSide.BUY
+        assert loaded.type == OrderType.MARKET
+        assert loaded.status == OrderStatus.FILLED
+        assert loaded.quantity == order.quantity
+    finally:
+        await client.close()
+    
+    assert client.db is None
+
+
+@pytest.mark.asyncio
+async def test_flush_without_writer_returns(config):
+    client = BinanceClient(config)
+    client._write_queue.put_nowait(('INSERT', ()))
+    
+    # No writer task before initialize(); flushing must not wait on the queue
+    await asyncio.wait_for(client.flush(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_burst_then_paced():
+    limiter = RateLimiter(rate_per_minute=600, burst=5)
+    loop = asyncio.get_running_loop()
+    
+    start = loop.time()
+    for _ in range(5):
+        await limiter.acquire()
+    assert loop.time() - start < 0.05
+    
+    await limiter.acquire()
+    assert loop.time() - start >= 0.09
+
+
+def test_round_uses_symbol_filters(config):
+    client = BinanceClient(config)
+    assert client._round_quantity(0.12345) == 0.123
+    
+    client._step_size, client._qty_precision = client._step_and_precision('0.00100000')
+    client._tick_size, client._price_precision = client._step_and_precision('0.10')
+    
+    assert client._qty_precision == 3
+    assert client._price_precision == 1
+    assert client._round_quantity(1.23456) == 1.234
+    assert client._round_price(50123.47) == 50123.4
+    assert client._step_and_precision('1.00000000') == (1.0, 0)
+
+
+class _FakeResponse:
+    status = 200
+    
+    def __init__(self, data):
+        self.data = data
+    
+    async def json(self, **kwargs):
+        return self.data
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _RecordingSession:
+    def __init__(self, responses=None):
+        self.calls = []
+        self.responses = list(responses or [])
+    
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return _FakeResponse(self.responses.pop(0) if self.responses else {'orderId': 1})
+
+
+@pytest.mark.asyncio
+async def test_signed_request_sends_signed_query(config, monkeypatch):
+    monkeypatch.setenv('BINANCE_TESTNET_API_SECRET', 'secret')
+    client = BinanceClient(config)
+    client.session = _RecordingSession()
+    
+    params = {'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': 0.01}
+    await client._request('POST', '/fapi/v1/order', signed=True, params=params)
+    
+    method, url, kwargs = client.session.calls[0]
+    query_string, signature = url.raw_query_string.rsplit('&signature=', 1)
+    
+    assert url.path == '/fapi/v1/order'
+    assert 'params' not in kwargs
+    assert query_string.startswith('quantity=0.01&side=BUY&symbol=BTCUSDT&timestamp=')
+    assert signature == hmac.new(b'secret', query_string.encode(), hashlib.sha256).hexdigest()
+    assert 'timestamp' not in params
+
+
+@pytest.mark.asyncio
+async def test_place_order_attaches_protective_orders(config, tmp_path, monkeypatch):
+    monkeypatch.setenv('BINANCE_TESTNET_API_KEY', 'key')
+    monkeypatch.setenv('BINANCE_TESTNET_API_SECRET', 'secret')
+    config['dry_run'] = False
+    client = BinanceClient(config)
+    client.order_db_path = str(tmp_path / 'orders.db')
+    await client._init_order_db()
+    
+    def order(order_id, order_type):
+        return {'orderId': order_id, 'symbol': 'BTCUSDT', 'side': 'BUY', 'type': order_type,
+                'origQty': '0.01', 'status': 'NEW'}
+    
+    client.session = _RecordingSession([
+        order(1, 'MARKET'), order(2, 'STOP_MARKET'), order(3, 'TAKE_PROFIT_MARKET')
+    ])
+    
+    try:
+        placed = await client.place_order(OrderSide.BUY, 0.01, stop_loss=49000.0, take_profit=52000.0)
+        
+        assert placed.stop_loss_order_id == 2
+        assert placed.take_profit_order_id == 3
+        assert (await client._load_order_state(1)).take_profit_order_id == 3
+    finally:
+        client.session = None
+        await client.close()
+
+
+def test_sign_matches_hmac(config):
+    client = BinanceClient(config)
+    for key in (b'secret', b'k' * 100):
+        client._hmac_inner, client._hmac_outer = client._hmac_pads(key)
+        assert client._sign('a=1&b=2') == hmac.new(key, b'a=1&b=2', hashlib.sha256).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_request_retries_transient_errors(config, monkeypatch):
+    class FlakySession(_RecordingSession):
+        def request(self, method, url, **kwargs):
+            response = super().request(method, url, **kwargs)
+            if len(self.calls) == 1:
+                raise aiohttp.ClientConnectionError()
+            return response
+    
+    sleeps = []
+    
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+    
+    monkeypatch.setattr(asyncio, 'sleep', fake_sleep)
+    client = BinanceClient(config)
+    client.session = FlakySession()
+    
+    assert await client._request('GET', '/fapi/v1/ping') == {'orderId': 1}
+    assert len(client.session.calls) == 2
+    assert sleeps == [2]
+
+
+@pytest.mark.asyncio
+async def test_account_balance_cached_within_ttl(config, monkeypatch):
+    monkeypatch.setenv('BINANCE_TESTNET_API_KEY', 'key')
+    monkeypatch.setenv('BINANCE_TESTNET_API_SECRET', 'secret')
+    config['dry_run'] = False
+    client = BinanceClient(config)
+    account = {'totalWalletBalance': '1500.0', 'availableBalance': '1200.0', 'totalUnrealizedProfit': '0'}
+    client.session = _RecordingSession([account, account])
+    
+    first = await client.get_account_balance()
+    second = await client.get_account_balance()
+    
+    assert first == second == {'total_equity': 1500.0, 'available_margin': 1200.0, 'unrealized_pnl': 0.0}
+    assert len(client.session.calls) == 1
+    
+    client._balance_cache = None
+    await client.get_account_balance()
+    assert len(client.session.calls) == 2
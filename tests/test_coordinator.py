@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import pytest
+import sys
+import os
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import coordinator as coordinator_module
+from coordinator import CoordinatorConfig, TradingCoordinator
+
+
+def _bare_coordinator(config):
+    """A coordinator with config only; no components or connections"""
+    coordinator = TradingCoordinator.__new__(TradingCoordinator)
+    coordinator.config = config
+    coordinator.cfg = CoordinatorConfig.from_dict(config)
+    coordinator.logger = logging.getLogger('coordinator')
+    coordinator.open_trades = {}
+    return coordinator
+
+
+@pytest.fixture
+def coordinator():
+    return _bare_coordinator({
+        'timing': {'heartbeat_interval': 60, 'candle_close_delay': 0.2},
+        'data': {'timeframes': ['5m']}
+    })
+
+
+def test_next_tick_on_grid(coordinator, monkeypatch):
+    monkeypatch.setattr(coordinator_module.time, 'time', lambda: 1200.0)
+    
+    assert coordinator._seconds_to_next_tick(60) == pytest.approx(60)
+
+
+def test_next_tick_mid_slot(coordinator, monkeypatch):
+    monkeypatch.setattr(coordinator_module.time, 'time', lambda: 1215.0)
+    
+    assert coordinator._seconds_to_next_tick(60) == pytest.approx(45)
+    assert coordinator._seconds_to_next_candle() == pytest.approx(285.2)
+
+
+def test_next_tick_skips_sliver_before_boundary(coordinator, monkeypatch):
+    # Woke a hair early on the loop clock; the slot ending now must not run twice
+    monkeypatch.setattr(coordinator_module.time, 'time', lambda: 1259.95)
+    
+    assert coordinator._seconds_to_next_tick(60) == pytest.approx(60.05)
+
+
+@pytest.mark.asyncio
+async def test_logging_survives_shutdown(tmp_path, monkeypatch):
+    # basicConfig only installs handlers on an unconfigured root logger
+    root = logging.getLogger()
+    monkeypatch.setattr(root, 'handlers', [])
+    monkeypatch.setattr(coordinator_module, 'TELEGRAM_AVAILABLE', False)
+    
+    log_file = tmp_path / 'coordinator.log'
+    coordinator = _bare_coordinator({'logging': {'file': str(log_file)}})
+    coordinator._setup_logging()
+    
+    coordinator._stop_event = asyncio.Event()
+    coordinator.api_server = None
+    coordinator._metrics_runner = None
+    coordinator.http = None
+    for name in ('data_logger', 'market_data', 'binance_client', 'ensemble'):
+        setattr(coordinator, name, AsyncMock())
+    
+    try:
+        await coordinator.shutdown()
+        logging.getLogger('teardown').warning('logged after shutdown')
+        await coordinator.shutdown()
+    finally:
+        for handler in root.handlers:
+            handler.close()
+    
+    contents = log_file.read_text()
+    assert 'Trading Coordinator shutdown complete' in contents
+    assert 'logged after shutdown' in contents
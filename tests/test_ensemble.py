@@ -96,3 +96,22 @@ def test_majority_vote_method(ensemble, config):
     result = ensemble.aggregate(predictions)
     
     assert result['action'] == 'long'
+
+
+@pytest.mark.asyncio
+async def test_prediction_deadline_drops_slow_models(config, monkeypatch):
+    import asyncio
+    
+    config['ensemble']['prediction_deadline_ms'] = 50
+    ensemble = EnsembleAggregator(config)
+    
+    async def fake_query(endpoint, snapshot):
+        if endpoint['name'] == 'model2':
+            await asyncio.sleep(1)
+        return {'model_name': endpoint['name'], 'action': 'long', 'confidence': 0.8}
+    
+    monkeypatch.setattr(ensemble, '_query_model', fake_query)
+    
+    predictions = await ensemble.get_model_predictions({})
+    
+    assert [p['model_name'] for p in predictions] == ['model1']
@@ -27,6 +27,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import aiohttp
+import orjson
 from aiohttp import web
 
 # Add parent directory to path for imports
@@ -118,18 +119,21 @@ def test_config(temp_dir):
     }
 
 
+# Constant mock payloads, encoded once
+_HEALTH_BYTES = orjson.dumps({
+    'status': 'healthy',
+    'model_loaded': True,
+    'last_prediction': datetime.utcnow().isoformat()
+})
+_RETRAIN_BYTES = orjson.dumps({'status': 'queued'})
+
+
 class MockModelServer:
-    """Mock model server for testing"""
+    """Per-model state for a mock model server served by MockModelCluster"""
     
     def __init__(self, name: str, port: int):
         self.name = name
         self.port = port
-        self.app = web.Application()
-        self.app.router.add_post('/predict', self.handle_predict)
-        self.app.router.add_get('/health', self.handle_health)
-        self.app.router.add_post('/retrain', self.handle_retrain)
-        self.runner = None
-        self.site = None
         
         # Configurable responses
         self.prediction_response = {
@@ -142,43 +146,69 @@ class MockModelServer:
         self.health_status = True
         self.request_count = 0
     
+    @property
+    def prediction_response(self) -> Dict:
+        return self._prediction_response
+    
+    @prediction_response.setter
+    def prediction_response(self, response: Dict):
+        # Re-encode only when a test swaps the response, not on every request
+        self._prediction_response = response
+        self.prediction_body = orjson.dumps(response)
+
+
+class MockModelCluster:
+    """Mock model servers sharing one aiohttp Application bound to one port per model"""
+    
+    def __init__(self, endpoints: List[Dict]):
+        self.servers = [MockModelServer(ep['name'], ep['port']) for ep in endpoints]
+        self._servers_by_port = {server.port: server for server in self.servers}
+        
+        self.app = web.Application()
+        self.app.router.add_post('/predict', self.handle_predict)
+        self.app.router.add_get('/health', self.handle_health)
+        self.app.router.add_post('/retrain', self.handle_retrain)
+        self.runner = None
+    
+    def _server_for(self, request) -> MockModelServer:
+        """Resolve the model whose port the request arrived on"""
+        port = request.transport.get_extra_info('sockname')[1]
+        return self._servers_by_port[port]
+    
     async def handle_predict(self, request):
         """Handle prediction request"""
-        self.request_count += 1
+        # The request body is never parsed; aiohttp drains it after the response
+        server = self._server_for(request)
+        server.request_count += 1
         await asyncio.sleep(0.1)  # Simulate processing
         
-        if not self.health_status:
+        if not server.health_status:
             raise web.HTTPServiceUnavailable(text="Model unhealthy")
         
-        return web.json_response(self.prediction_response)
+        return web.Response(body=server.prediction_body, content_type='application/json')
     
     async def handle_health(self, request):
         """Handle health check"""
-        if not self.health_status:
+        if not self._server_for(request).health_status:
             raise web.HTTPServiceUnavailable(text="Model unhealthy")
         
-        return web.json_response({
-            'status': 'healthy',
-            'model_loaded': True,
-            'last_prediction': datetime.utcnow().isoformat()
-        })
+        return web.Response(body=_HEALTH_BYTES, content_type='application/json')
     
     async def handle_retrain(self, request):
         """Handle retrain request"""
-        return web.json_response({'status': 'queued'})
+        return web.Response(body=_RETRAIN_BYTES, content_type='application/json')
     
     async def start(self):
-        """Start mock server"""
-        self.runner = web.AppRunner(self.app)
+        """Start one runner and a TCP site per mock model"""
+        self.runner = web.AppRunner(self.app, access_log=None)
         await self.runner.setup()
-        self.site = web.TCPSite(self.runner, '127.0.0.1', self.port)
-        await self.site.start()
-        logging.info(f"Mock {self.name} started on port {self.port}")
+        for server in self.servers:
+            # Returns once the socket is bound and listening, so no ready wait is needed
+            await web.TCPSite(self.runner, '127.0.0.1', server.port).start()
+            logging.info(f"Mock {server.name} started on port {server.port}")
     
     async def stop(self):
-        """Stop mock server"""
-        if self.site:
-            await self.site.stop()
+        """Stop all mock models"""
         if self.runner:
             await self.runner.cleanup()
 
@@ -186,18 +216,13 @@ class MockModelServer:
 @pytest.fixture
 async def mock_model_servers(test_config):
     """Start mock model servers"""
-    servers = []
-    
-    for endpoint in test_config['model_endpoints']:
-        server = MockModelServer(endpoint['name'], endpoint['port'])
-        await server.start()
-        servers.append(server)
+    cluster = MockModelCluster(test_config['model_endpoints'])
+    await cluster.start()
     
-    yield servers
+    yield cluster.servers
     
     # Cleanup
-    for server in servers:
-        await server.stop()
+    await cluster.stop()
 
 
 @pytest.mark.asyncio
@@ -213,15 +238,13 @@ async def test_market_data_collection(test_config):
 async def test_ensemble_aggregation(test_config):
     """Test ensemble aggregation with mock model responses"""
     # Start mock servers manually
-    servers = []
-    for endpoint in test_config['model_endpoints']:
-        server = MockModelServer(endpoint['name'], endpoint['port'])
-        await server.start()
-        servers.append(server)
+    cluster = MockModelCluster(test_config['model_endpoints'])
+    await cluster.start()
+    servers = cluster.servers
+    
+    ensemble = EnsembleAggregator(test_config)
     
     try:
-        ensemble = EnsembleAggregator(test_config)
-        
         # Configure different responses from models
         servers[0].prediction_response = {
             'action': 'long', 'confidence': 0.80, 'stop': 50000, 'take_profit': 52000, 'raw_score': 0.80
@@ -236,9 +259,6 @@ async def test_ensemble_aggregation(test_config):
             'action': 'long', 'confidence': 0.70, 'stop': 50050, 'take_profit': 52100, 'raw_score': 0.70
         }
         
-        # Wait for servers to be ready
-        await asyncio.sleep(0.5)
-        
         # Mock snapshot
         snapshot = {
             'timestamp': datetime.utcnow().isoformat(),
@@ -273,8 +293,8 @@ async def test_ensemble_aggregation(test_config):
     
     finally:
         # Cleanup servers
-        for server in servers:
-            await server.stop()
+        await ensemble.close()
+        await cluster.stop()
 
 
 @pytest.mark.asyncio
@@ -363,6 +383,17 @@ async def test_data_logger_schema_v2(test_config):
         expected_return=0.015,
         latency_ms=100.0
     )
+    await logger.log_model_predictions(snapshot_id, [
+        {'model_name': 'model_2', 'action': 'short', 'confidence': 0.6},
+        {'model_name': 'model_3', 'action': 'hold', 'confidence': 0.5}
+    ])
+    await logger.flush()
+    
+    async with logger.db.execute(
+        "SELECT model_name FROM model_predictions WHERE snapshot_id = ? ORDER BY prediction_id",
+        (snapshot_id,)
+    ) as cursor:
+        assert [row[0] for row in await cursor.fetchall()] == ['model_1', 'model_2', 'model_3']
     
     # Test 3: Log ensemble decision (fix parameters)
     await logger.log_ensemble_decision(
@@ -427,6 +458,9 @@ async def test_data_logger_schema_v2(test_config):
     assert trades[0]['trade_id'] == trade_id
     assert trades[0]['pnl'] == 500.0
     
+    streamed = [trade async for trade in logger.stream_recent_trades(limit=10)]
+    assert streamed == trades
+    
     # Test 9: Query model performance (may be empty if no predictions logged)
     stats = await logger.get_model_performance_stats(days=1)
     # Stats may be empty dict if no model predictions were logged in this test
@@ -488,17 +522,13 @@ async def test_graceful_shutdown(test_config):
 async def test_model_health_monitoring(test_config):
     """Test model health checks and failure handling"""
     # Start mock servers manually
-    servers = []
-    for endpoint in test_config['model_endpoints']:
-        server = MockModelServer(endpoint['name'], endpoint['port'])
-        await server.start()
-        servers.append(server)
+    cluster = MockModelCluster(test_config['model_endpoints'])
+    await cluster.start()
+    servers = cluster.servers
+    
+    ensemble = EnsembleAggregator(test_config)
     
     try:
-        await asyncio.sleep(0.5)  # Wait for servers to start
-        
-        ensemble = EnsembleAggregator(test_config)
-        
         # All models healthy
         health_results = await ensemble.check_model_health()
         healthy_count = sum(1 for r in health_results if isinstance(r, dict) and r.get('healthy'))
@@ -521,8 +551,8 @@ async def test_model_health_monitoring(test_config):
         logging.info("Model health monitoring test passed")
     
     finally:
-        for server in servers:
-            await server.stop()
+        await ensemble.close()
+        await cluster.stop()
 
 
 if __name__ == '__main__':